@@ -7,10 +7,10 @@ echo "🧪 Running gh-toolkit test suite..."
 
 # Unit tests
 echo "📋 Running unit tests..."
-uv run pytest tests/unit/ -v
+uv run pytest tests/unit/ -v -n auto --dist=loadfile
 
 # Integration tests  
 echo "🔗 Running integration tests..."
-uv run pytest tests/integration/ -v
+uv run pytest tests/integration/ -v -n auto --dist=loadfile
 
 echo "✅ All tests completed!"
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Site generation commands for portfolio presentation."""
 
 import json
+import sys
 from pathlib import Path
 from typing import Any, cast
 
@@ -15,7 +16,7 @@ console = Console()
 
 def generate_site(
     repos_data: str = typer.Argument(
-        help="Path to extracted repos JSON file or YAML file"
+        help="Path to extracted repos JSON file or YAML file, or - for JSON on stdin"
     ),
     theme: str = typer.Option(
         "educational",
@@ -48,44 +49,43 @@ def generate_site(
         gh-toolkit site generate repos.json --theme educational --output my_portfolio.html
     """
     try:
-        # Load repository data
-        repos_path = Path(repos_data)
-        if not repos_path.exists():
-            console.print(f"[red]✗ Repository data file not found: {repos_data}[/red]")
-            raise typer.Exit(1)
+        # Load repository data ("-" reads JSON from stdin)
+        if repos_data == "-":
+            console.print("[blue]📂 Loading repository data from stdin[/blue]")
+            data = json.loads(sys.stdin.read())
+            data_format = "JSON"
+        else:
+            repos_path = Path(repos_data)
+            if not repos_path.exists():
+                console.print(f"[red]✗ Repository data file not found: {repos_data}[/red]")
+                raise typer.Exit(1)
 
-        console.print(f"[blue]📂 Loading repository data from {repos_path}[/blue]")
+            console.print(f"[blue]📂 Loading repository data from {repos_path}[/blue]")
+
+            # Determine file format and load data
+            if repos_path.suffix.lower() == ".json":
+                with open(repos_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                data_format = "JSON"
+            elif repos_path.suffix.lower() in [".yaml", ".yml"]:
+                with open(repos_path, encoding="utf-8") as f:
+                    data = yaml.safe_load(f)
+                data_format = "YAML"
+            else:
+                console.print(
+                    f"[red]✗ Unsupported file format: {repos_path.suffix}. Use .json or .yaml/.yml[/red]"
+                )
+                raise typer.Exit(1)
 
-        # Determine file format and load data
+        # Handle both direct list and nested structure
         repos_list: list[dict[str, Any]] = []
-        if repos_path.suffix.lower() == ".json":
-            with open(repos_path, encoding="utf-8") as f:
-                data = json.load(f)
-                # Handle both direct list and nested structure
-                if isinstance(data, list):
-                    repos_list = data  # type: ignore[assignment]
-                elif isinstance(data, dict) and "repositories" in data:
-                    repos_list = data["repositories"]  # type: ignore[assignment]
-                else:
-                    console.print(
-                        "[red]✗ Invalid JSON format. Expected list of repositories or object with 'repositories' key[/red]"
-                    )
-                    raise typer.Exit(1)
-        elif repos_path.suffix.lower() in [".yaml", ".yml"]:
-            with open(repos_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if isinstance(data, list):
-                    repos_list = data  # type: ignore[assignment]
-                elif isinstance(data, dict) and "repositories" in data:
-                    repos_list = data["repositories"]  # type: ignore[assignment]
-                else:
-                    console.print(
-                        "[red]✗ Invalid YAML format. Expected list of repositories or object with 'repositories' key[/red]"
-                    )
-                    raise typer.Exit(1)
+        if isinstance(data, list):
+            repos_list = data  # type: ignore[assignment]
+        elif isinstance(data, dict) and "repositories" in data:
+            repos_list = data["repositories"]  # type: ignore[assignment]
         else:
             console.print(
-                f"[red]✗ Unsupported file format: {repos_path.suffix}. Use .json or .yaml/.yml[/red]"
+                f"[red]✗ Invalid {data_format} format. Expected list of repositories or object with 'repositories' key[/red]"
             )
             raise typer.Exit(1)
 
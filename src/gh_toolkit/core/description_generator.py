@@ -1,6 +1,7 @@
 """Description generation functionality for GitHub repositories."""
 
 import time
+from collections.abc import Callable
 from typing import Any
 
 from rich.console import Console
@@ -21,6 +22,7 @@ class DescriptionGenerator:
         anthropic_api_key: str | None = None,
         rate_limit: float = 0.5,
         model: str | None = None,
+        sleep: Callable[[float], None] = time.sleep,
     ):
         """Initialize with GitHub client and optional Anthropic API key.
 
@@ -29,11 +31,13 @@ class DescriptionGenerator:
             anthropic_api_key: Optional Anthropic API key for LLM features
             rate_limit: Seconds to wait between API requests (default: 0.5)
             model: Anthropic model to use (default: claude-3-haiku-20240307)
+            sleep: Called with rate_limit to wait between repositories
         """
         self.client = github_client
         self.anthropic_api_key = anthropic_api_key
         self.rate_limit = rate_limit
         self.model = model or self.DEFAULT_MODEL
+        self._sleep = sleep
 
         if anthropic_api_key:
             try:
@@ -329,6 +333,6 @@ Only output the description, nothing else.
 
             # Rate limiting
             if i < len(repo_list) and self.rate_limit > 0:
-                time.sleep(self.rate_limit)
+                self._sleep(self.rate_limit)
 
         return results
@@ -1,15 +1,38 @@
 """Shared GitHub API client with rate limiting and error handling."""
 
+import json
 import os
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    loads_json: Callable[[bytes | str], Any] = orjson.loads
+except ImportError:  # orjson is optional (tui extra); fall back to the stdlib parser
+    loads_json = json.loads
+
+# Transient failures that are retried, with exponential backoff, for GET requests
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Most repositories looked up in a single GraphQL request (one aliased field each)
+GRAPHQL_BATCH_SIZE = 100
+
+# Default pooled connections per host, enough for get_all_pages and small thread pools
+HTTP_POOL_MAXSIZE = 16
+
 
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors."""
@@ -28,12 +51,25 @@ class GitHubAPIError(Exception):
 class GitHubClient:
     """GitHub API client with rate limiting and error handling."""
 
-    def __init__(self, token: str | None = None):
+    def __init__(
+        self,
+        token: str | None = None,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        session: requests.Session | None = None,
+    ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token. If None, will try to get from
                    GITHUB_TOKEN environment variable.
+            pool_maxsize: Keep-alive connections kept per host; set this to at
+                          least the number of threads sharing the client, so
+                          each reuses a warm TLS connection
+            session: Existing session to send requests through; its adapters
+                     are kept as they are (pool_maxsize is ignored). The
+                     client's headers, token included, go on each request and
+                     are never stored on the session, so clients with
+                     different tokens can share it
         """
         self.token = token or os.environ.get("GITHUB_TOKEN")
 
@@ -45,8 +81,10 @@ class GitHubClient:
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+        self.session = session
         self._authenticated_user: str | None = None
 
     def get_authenticated_user(self) -> str | None:
@@ -76,15 +114,21 @@ class GitHubClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         timeout: int = 30,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
         """Make a request to GitHub API with error handling.
 
+        GET requests that time out or return a 5xx status are retried up to
+        MAX_RETRIES times with exponential backoff; other failures, such as
+        auth errors or refused connections, fail immediately.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint: API endpoint (e.g., "/user/repos")
             params: Query parameters
             json_data: JSON data for POST/PUT requests
             timeout: Request timeout in seconds
+            headers: Extra headers for this request only
 
         Returns:
             Response object
@@ -93,44 +137,60 @@ class GitHubClient:
             GitHubAPIError: If the request fails
         """
         url = f"{self.base_url}{endpoint}"
+        retries = MAX_RETRIES if method.upper() == "GET" else 0
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    timeout=timeout,
+                    headers={**self.headers, **headers} if headers else self.headers,
+                )
+            except requests.exceptions.Timeout as e:
+                if attempt >= retries:
+                    raise GitHubAPIError(f"Request failed: {str(e)}") from e
+            except requests.exceptions.RequestException as e:
+                raise GitHubAPIError(f"Request failed: {str(e)}") from e
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
+                    break
 
-        try:
-            response = self.session.request(
-                method=method, url=url, params=params, json=json_data, timeout=timeout
-            )
+            time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+            attempt += 1
+
+        # Check rate limiting
+        if response.status_code == 403 and "rate limit" in response.text.lower():
+            reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+            current_time = int(time.time())
+            wait_time = max(0, reset_time - current_time)
+
+            if wait_time > 0:
+                console.print(
+                    f"[yellow]Rate limit reached. Waiting {wait_time} seconds...[/yellow]"
+                )
+                time.sleep(wait_time + 1)
+                # Retry the request
+                return self._make_request(
+                    method, endpoint, params, json_data, timeout, headers
+                )
+
+        # Check for other errors
+        if not response.ok:
+            error_msg = f"GitHub API error: {response.status_code}"
+            try:
+                error_data = response.json()
+                if "message" in error_data:
+                    error_msg += f" - {error_data['message']}"
+            except Exception:
+                error_msg += f" - {response.text[:200]}"
+
+            raise GitHubAPIError(error_msg, response.status_code)
 
-            # Check rate limiting
-            if response.status_code == 403 and "rate limit" in response.text.lower():
-                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                current_time = int(time.time())
-                wait_time = max(0, reset_time - current_time)
-
-                if wait_time > 0:
-                    console.print(
-                        f"[yellow]Rate limit reached. Waiting {wait_time} seconds...[/yellow]"
-                    )
-                    time.sleep(wait_time + 1)
-                    # Retry the request
-                    return self._make_request(
-                        method, endpoint, params, json_data, timeout
-                    )
-
-            # Check for other errors
-            if not response.ok:
-                error_msg = f"GitHub API error: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "message" in error_data:
-                        error_msg += f" - {error_data['message']}"
-                except Exception:
-                    error_msg += f" - {response.text[:200]}"
-
-                raise GitHubAPIError(error_msg, response.status_code)
-
-            return response
-
-        except requests.exceptions.RequestException as e:
-            raise GitHubAPIError(f"Request failed: {str(e)}") from e
+        return response
 
     def get_paginated(
         self,
@@ -177,6 +237,11 @@ class GitHubClient:
                     break
 
                 items.extend(page_items)
+
+                # Without a rel="next" link this was the last page
+                if "next" not in response.links:
+                    break
+
                 page += 1
 
                 # Small delay to be nice to the API
@@ -184,6 +249,92 @@ class GitHubClient:
 
         return items
 
+    def get_all_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+        max_workers: int = 8,
+        on_page: Callable[[list[dict[str, Any]]], None] | None = None,
+        page_cache: dict[int, tuple[str, list[dict[str, Any]]]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get all pages from a paginated endpoint, fetching pages concurrently.
+
+        The first page is requested on its own; its ``Link: rel="last"`` header
+        gives the page count, and the remaining pages are then fetched in
+        parallel. Unlike get_paginated this shows no progress spinner, so it
+        is safe to call from the TUI.
+
+        With a page_cache, each page is requested conditionally with the ETag
+        from the cache; a 304 reuses the cached items and doesn't count
+        against the rate limit. The cache is updated in place.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Items per page (max 100)
+            max_workers: Maximum number of concurrent page requests
+            on_page: Called with each page's items as soon as that page (and
+                     every page before it) has arrived, in page order
+            page_cache: Page number -> (ETag, items) from a previous call
+
+        Returns:
+            List of all items from all pages, in page order
+        """
+        params = dict(params or {})
+        params["per_page"] = min(per_page, 100)
+
+        def fetch_page(page: int) -> tuple[list[dict[str, Any]], requests.Response]:
+            cached = page_cache.get(page) if page_cache is not None else None
+            response = self._make_request(
+                "GET",
+                endpoint,
+                {**params, "page": page},
+                headers={"If-None-Match": cached[0]} if cached else None,
+            )
+            if response.status_code == 304 and cached:
+                return cached[1], response
+
+            page_items: list[dict[str, Any]] = loads_json(response.content)
+            if page_cache is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    page_cache[page] = (etag, page_items)
+                else:
+                    page_cache.pop(page, None)
+            return page_items, response
+
+        items, response = fetch_page(1)
+        items = list(items)
+        if on_page and items:
+            on_page(items)
+
+        last_link = response.links.get("last", {}).get("url")
+        if last_link:
+            last_page = int(parse_qs(urlparse(last_link).query).get("page", ["1"])[0])
+        elif response.status_code == 304 and page_cache:
+            # Not-modified responses may omit Link; the cache knows the page count
+            last_page = max(page_cache)
+        else:
+            last_page = 1
+        if not items:
+            last_page = 1
+
+        if page_cache is not None:
+            for stale_page in [page for page in page_cache if page > last_page]:
+                del page_cache[stale_page]
+
+        if last_page < 2:
+            return items
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, last_page - 1)) as pool:
+            for page_items, _ in pool.map(fetch_page, range(2, last_page + 1)):
+                items.extend(page_items)
+                if on_page and page_items:
+                    on_page(page_items)
+
+        return items
+
     def get_user_repos(
         self,
         username: str | None = None,
@@ -452,6 +603,73 @@ class GitHubClient:
         except Exception:
             return None
 
+    def get_repos_bulk(
+        self, repo_pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Get description, license and topics for many repositories at once.
+
+        Issues one GraphQL request per GRAPHQL_BATCH_SIZE repositories, with
+        an aliased ``repository`` field per repo, instead of two REST calls
+        per repo. GraphQL requires authentication.
+
+        Args:
+            repo_pairs: (owner, repo) pairs
+
+        Returns:
+            (owner, repo) -> {"description", "license", "topics"}, with license
+            shaped like the REST field ({"key": ...} or None). Repositories
+            that could not be read are left out.
+
+        Raises:
+            GitHubAPIError: If a request fails or returns no data
+        """
+        repos: dict[tuple[str, str], dict[str, Any]] = {}
+        for start in range(0, len(repo_pairs), GRAPHQL_BATCH_SIZE):
+            batch = repo_pairs[start : start + GRAPHQL_BATCH_SIZE]
+            # Owner/name go in as variables, so they never need escaping
+            declarations = ", ".join(
+                f"$o{i}: String!, $n{i}: String!" for i in range(len(batch))
+            )
+            fields = " ".join(
+                f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ description "
+                "licenseInfo { key } "
+                "repositoryTopics(first: 20) { nodes { topic { name } } } }"
+                for i in range(len(batch))
+            )
+            variables: dict[str, str] = {}
+            for i, (owner, repo) in enumerate(batch):
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = repo
+
+            response = self._make_request(
+                "POST",
+                "/graphql",
+                json_data={
+                    "query": f"query({declarations}) {{ {fields} }}",
+                    "variables": variables,
+                },
+            )
+            body = response.json()
+            data = body.get("data")
+            if data is None:
+                errors = body.get("errors") or [{}]
+                raise GitHubAPIError(errors[0].get("message", "GraphQL query failed"))
+
+            for i, pair in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node is None:
+                    continue
+                license_info = node.get("licenseInfo")
+                repos[pair] = {
+                    "description": node.get("description"),
+                    "license": {"key": license_info["key"]} if license_info else None,
+                    "topics": [
+                        topic_node["topic"]["name"]
+                        for topic_node in node["repositoryTopics"]["nodes"]
+                    ],
+                }
+        return repos
+
     def get_repo_tree(
         self, owner: str, repo: str, branch: str | None = None
     ) -> list[dict[str, Any]]:
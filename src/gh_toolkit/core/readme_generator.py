@@ -2,8 +2,9 @@
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from rich.console import Console
 
@@ -11,6 +12,59 @@ from gh_toolkit.core.github_client import GitHubAPIError, GitHubClient
 
 console = Console()
 
+# Topics that name a category outright, checked in order
+_TOPIC_CATEGORIES = {
+    "library": "Libraries",
+    "cli": "CLI Tools",
+    "web-app": "Web Applications",
+    "api": "APIs",
+    "tutorial": "Learning Resources",
+    "education": "Learning Resources",
+    "documentation": "Documentation",
+    "template": "Templates",
+}
+
+_LANGUAGE_CATEGORIES = {
+    "python": "Python Projects",
+    "javascript": "JavaScript Projects",
+    "typescript": "TypeScript Projects",
+    "rust": "Rust Projects",
+    "go": "Go Projects",
+}
+
+
+@lru_cache(maxsize=1024)
+def _infer_category(
+    name: str, description: str, language: str, topics: tuple[str, ...]
+) -> str:
+    """Infer a repository category (repos are re-categorized on every README)."""
+    name_lower = name.lower()
+    desc_lower = description.lower()
+    topics_lower = [t.lower() for t in topics]
+    language = language.lower()
+
+    # Check topics first for explicit categories
+    for topic, category in _TOPIC_CATEGORIES.items():
+        if topic in topics_lower:
+            return category
+
+    # Check name and description patterns
+    if any(x in name_lower for x in ["template", "boilerplate", "starter"]):
+        return "Templates"
+    if any(x in name_lower for x in ["api", "service"]):
+        return "APIs"
+    if any(x in desc_lower for x in ["cli", "command-line", "terminal"]):
+        return "CLI Tools"
+    if any(x in desc_lower for x in ["library", "package", "module"]):
+        return "Libraries"
+    if any(x in desc_lower for x in ["web app", "webapp", "website"]):
+        return "Web Applications"
+    if any(x in desc_lower for x in ["tutorial", "learn", "course"]):
+        return "Learning Resources"
+
+    # Fallback to language-based categories
+    return _LANGUAGE_CATEGORIES.get(language, "Other Projects")
+
 
 class OrgReadmeGenerator:
     """Generate profile README for a GitHub organization."""
@@ -116,49 +170,12 @@ class OrgReadmeGenerator:
         Returns:
             Category string
         """
-        name_lower = repo.get("name", "").lower()
-        desc_lower = (repo.get("description") or "").lower()
-        topics = [t.lower() for t in repo.get("topics", [])]
-        language = (repo.get("language") or "").lower()
-
-        # Check topics first for explicit categories
-        topic_categories = {
-            "library": "Libraries",
-            "cli": "CLI Tools",
-            "web-app": "Web Applications",
-            "api": "APIs",
-            "tutorial": "Learning Resources",
-            "education": "Learning Resources",
-            "documentation": "Documentation",
-            "template": "Templates",
-        }
-        for topic, category in topic_categories.items():
-            if topic in topics:
-                return category
-
-        # Check name and description patterns
-        if any(x in name_lower for x in ["template", "boilerplate", "starter"]):
-            return "Templates"
-        if any(x in name_lower for x in ["api", "service"]):
-            return "APIs"
-        if any(x in desc_lower for x in ["cli", "command-line", "terminal"]):
-            return "CLI Tools"
-        if any(x in desc_lower for x in ["library", "package", "module"]):
-            return "Libraries"
-        if any(x in desc_lower for x in ["web app", "webapp", "website"]):
-            return "Web Applications"
-        if any(x in desc_lower for x in ["tutorial", "learn", "course"]):
-            return "Learning Resources"
-
-        # Fallback to language-based categories
-        language_categories = {
-            "python": "Python Projects",
-            "javascript": "JavaScript Projects",
-            "typescript": "TypeScript Projects",
-            "rust": "Rust Projects",
-            "go": "Go Projects",
-        }
-        return language_categories.get(language, "Other Projects")
+        return _infer_category(
+            repo.get("name", ""),
+            repo.get("description") or "",
+            repo.get("language") or "",
+            tuple(repo.get("topics", [])),
+        )
 
     def generate_org_description(
         self, org_info: dict[str, Any], repos: list[dict[str, Any]]
@@ -569,13 +586,17 @@ JSON only, no markdown code blocks:"""
 
         return "\n".join(lines)
 
-    def save_readme(self, content: str, output_path: str) -> None:
+    def save_readme(self, content: str, output_path: str | Path | TextIO) -> None:
         """Save README content to file.
 
         Args:
             content: README markdown content
-            output_path: Output file path
+            output_path: Output file path, or an open text stream to write to
         """
+        if not isinstance(output_path, str | Path):
+            output_path.write(content)
+            return
+
         path = Path(output_path)
         path.write_text(content, encoding="utf-8")
         console.print(f"[green]README saved to {path.absolute()}[/green]")
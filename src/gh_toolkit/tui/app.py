@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
+import json
 import os
+import time
+from collections.abc import Callable
 from typing import Any
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Footer, Header
 
-from gh_toolkit.core.github_client import GitHubClient
+from gh_toolkit.core.github_client import GitHubClient, loads_json
+from gh_toolkit.tui.cache import CACHE_DIR, write_cache_file
+from gh_toolkit.tui.screens.help import HelpScreen
 from gh_toolkit.tui.screens.home import HomeScreen
 
+# How long fetched org repository lists are reused before refetching
+ORG_REPOS_TTL_SECONDS = 300.0
+
+# Per-page ETags and repos for each org, so refetches can be conditional requests
+ORG_CACHE_DIR = CACHE_DIR / "orgs"
+
+
+def _load_page_cache(org_name: str) -> dict[int, tuple[str, list[dict[str, Any]]]]:
+    """Load an org's cached repo pages from disk (empty if missing or unreadable)."""
+    try:
+        data = loads_json((ORG_CACHE_DIR / f"{org_name}.json").read_bytes())
+        return {int(page): (etag, items) for page, (etag, items) in data["pages"].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _save_page_cache(
+    org_name: str, page_cache: dict[int, tuple[str, list[dict[str, Any]]]]
+) -> None:
+    """Write an org's repo pages to disk; failures only cost the next refetch."""
+    data = {"pages": {str(page): [etag, items] for page, (etag, items) in page_cache.items()}}
+    write_cache_file(ORG_CACHE_DIR / f"{org_name}.json", json.dumps(data))
+
 
 class GhToolkitApp(App[None]):
     """Main gh-toolkit TUI application."""
@@ -29,7 +57,11 @@ class GhToolkitApp(App[None]):
         super().__init__()
         token = os.environ.get("GITHUB_TOKEN", "")
         self.github_client = GitHubClient(token)
-        self._org_cache: dict[str, list[dict[str, Any]]] = {}
+        # org name -> (fetch time from time.monotonic(), repos)
+        self._org_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        # Bumped whenever cached repos are cleared, so a fetch that started
+        # before the clear doesn't store its (now stale) result afterwards
+        self._org_cache_epoch = 0
         self._orgs: list[dict[str, Any]] = []
 
     def compose(self) -> ComposeResult:
@@ -44,32 +76,54 @@ class GhToolkitApp(App[None]):
     def get_organizations(self) -> list[dict[str, Any]]:
         """Get cached organizations or fetch from API."""
         if not self._orgs:
-            self._orgs = self.github_client.get_user_organizations()
+            self._orgs = self.github_client.get_all_pages("/user/orgs")
         return self._orgs
 
-    def get_org_repos(self, org_name: str) -> list[dict[str, Any]]:
-        """Get cached repos for an org or fetch from API."""
-        if org_name not in self._org_cache:
-            self._org_cache[org_name] = self.github_client.get_paginated(
-                f"/orgs/{org_name}/repos"
-            )
-        return self._org_cache[org_name]
+    def get_org_repos(
+        self,
+        org_name: str,
+        on_page: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get cached repos for an org or fetch from API.
+
+        Cached lists expire after ORG_REPOS_TTL_SECONDS. Refetches send the
+        ETags saved in ORG_CACHE_DIR, so unchanged pages come back as 304s. If
+        given, on_page is called with each page of repos as it arrives (or
+        once with the whole cached list). A fetch overtaken by
+        clear_org_cache or a refresh returns its repos without caching them.
+        """
+        now = time.monotonic()
+        cached = self._org_cache.get(org_name)
+        if cached is not None and now - cached[0] < ORG_REPOS_TTL_SECONDS:
+            if on_page and cached[1]:
+                on_page(cached[1])
+            return cached[1]
+
+        epoch = self._org_cache_epoch
+        page_cache = _load_page_cache(org_name)
+        repos = self.github_client.get_all_pages(
+            f"/orgs/{org_name}/repos", on_page=on_page, page_cache=page_cache
+        )
+        if epoch == self._org_cache_epoch:
+            _save_page_cache(org_name, page_cache)
+            self._org_cache[org_name] = (now, repos)
+        return repos
 
     def action_refresh(self) -> None:
         """Clear cache and refresh current screen."""
         self._orgs = []
         self._org_cache = {}
+        self._org_cache_epoch += 1
         current = self.screen
         if hasattr(current, "refresh_data"):
             current.refresh_data()  # type: ignore[attr-defined]
 
     def action_help(self) -> None:
         """Show help information."""
-        from gh_toolkit.tui.screens.help import HelpScreen
-
         self.push_screen(HelpScreen())
 
     def clear_org_cache(self, org_name: str) -> None:
         """Clear cached data for a specific organization."""
         if org_name in self._org_cache:
             del self._org_cache[org_name]
+        self._org_cache_epoch += 1
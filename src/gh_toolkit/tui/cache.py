@@ -0,0 +1,35 @@
+"""On-disk cache location and helpers for the TUI."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+# Root of the TUI's on-disk caches (honours XDG_CACHE_HOME)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gh-toolkit"
+
+
+def write_cache_file(path: Path, content: str) -> None:
+    """Write a cache file atomically; failures only cost a later cache miss.
+
+    Args:
+        path: Destination file; parent directories are created as needed
+        content: Text to write
+    """
+    tmp_path: Path | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a private temp file and swap it in so readers never see a partial file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(content)
+        tmp_path.replace(path)
+    except OSError:
+        # Don't leave a stray temp file behind for every failed write
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
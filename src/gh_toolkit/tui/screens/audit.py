@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import webbrowser
 from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
 from textual.screen import Screen
-from textual.widgets import Label, ListItem, ListView, Static
+from textual.widgets import DataTable, Static
 from textual.worker import Worker, WorkerState
 
 from gh_toolkit.core.portfolio_generator import PortfolioGenerator
@@ -17,24 +19,16 @@ if TYPE_CHECKING:
     from gh_toolkit.tui.app import GhToolkitApp
 
 
-class IssueListItem(ListItem):
-    """A list item representing an audit issue."""
+def format_issue_row(issue: dict[str, Any]) -> tuple[str, str, str]:
+    """Build the (icon, repo, issue) table cells for an audit issue."""
+    repo = issue.get("repo", "Unknown")
+    issue_type = issue.get("issue_type", "").replace("_", " ").title()
+    severity = issue.get("severity", "warning")
 
-    def __init__(self, issue: dict[str, Any]) -> None:
-        super().__init__()
-        self.issue = issue
-
-    def compose(self) -> ComposeResult:
-        """Compose the issue list item."""
-        repo = self.issue.get("repo", "Unknown")
-        issue_type = self.issue.get("issue_type", "").replace("_", " ").title()
-        severity = self.issue.get("severity", "warning")
+    # Format icon based on severity
+    icon = "\u26d4" if severity == "error" else "\u26a0"  # ⛔ or ⚠
 
-        # Format icon based on severity
-        icon = "\u26d4" if severity == "error" else "\u26a0"  # ⛔ or ⚠
-
-        display = f"{icon} {repo}: {issue_type}"
-        yield Label(display)
+    return (icon, repo, issue_type)
 
 
 class AuditScreen(Screen[None]):
@@ -52,6 +46,9 @@ class AuditScreen(Screen[None]):
         self.org_name = org_name
         self.repos = repos
         self._audit_report: dict[str, Any] = {}
+        # Issues backing each table, indexed by row for cursor lookups
+        self._errors_by_row: list[dict[str, Any]] = []
+        self._warnings_by_row: list[dict[str, Any]] = []
         self._is_auditing = False
 
     @property
@@ -66,9 +63,9 @@ class AuditScreen(Screen[None]):
             Static("", id="audit-summary", classes="audit-summary"),
             VerticalScroll(
                 Static("", id="errors-header", classes="audit-section-header"),
-                ListView(id="errors-list", classes="audit-list"),
+                DataTable(id="errors-table", classes="audit-list", cursor_type="row"),
                 Static("", id="warnings-header", classes="audit-section-header"),
-                ListView(id="warnings-list", classes="audit-list"),
+                DataTable(id="warnings-table", classes="audit-list", cursor_type="row"),
                 id="audit-scroll",
             ),
             classes="content",
@@ -91,10 +88,11 @@ class AuditScreen(Screen[None]):
             self._do_audit,
             name="audit_repos",
             exclusive=True,
+            thread=True,
         )
 
-    async def _do_audit(self) -> dict[str, Any]:
-        """Run audit (in worker)."""
+    def _do_audit(self) -> dict[str, Any]:
+        """Run audit (in a thread worker, off the event loop)."""
         generator = PortfolioGenerator(self.app.github_client)
 
         # Add source_org to repos for the audit
@@ -144,49 +142,47 @@ class AuditScreen(Screen[None]):
 
         # Update errors section
         errors_header = self.query_one("#errors-header", Static)
-        errors_list = self.query_one("#errors-list", ListView)
-        errors_list.clear()
-
-        if errors:
-            errors_header.update(f"Errors ({len(errors)})")
-            for issue in errors:
-                errors_list.append(IssueListItem(issue))
-        else:
-            errors_header.update("Errors (0)")
+        errors_table = self.query_one("#errors-table", DataTable)
+        errors_header.update(f"Errors ({len(errors)})")
+        self._errors_by_row = errors
+        self._populate_table(errors_table, errors)
 
         # Update warnings section
         warnings_header = self.query_one("#warnings-header", Static)
-        warnings_list = self.query_one("#warnings-list", ListView)
-        warnings_list.clear()
-
-        if warnings:
-            warnings_header.update(f"Warnings ({len(warnings)})")
-            for issue in warnings:
-                warnings_list.append(IssueListItem(issue))
-        else:
-            warnings_header.update("Warnings (0)")
+        warnings_table = self.query_one("#warnings-table", DataTable)
+        warnings_header.update(f"Warnings ({len(warnings)})")
+        self._warnings_by_row = warnings
+        self._populate_table(warnings_table, warnings)
 
-        # Focus on errors list if there are errors, otherwise warnings
+        # Focus on errors table if there are errors, otherwise warnings
         if errors:
-            errors_list.focus()
+            errors_table.focus()
         elif warnings:
-            warnings_list.focus()
+            warnings_table.focus()
+
+    def _populate_table(self, table: DataTable[str], issues: list[dict[str, Any]]) -> None:
+        """Fill an issues table with one row per issue."""
+        table.clear(columns=True)
+        table.add_columns("", "Repo", "Issue")
+        table.add_rows([format_issue_row(issue) for issue in issues])
 
     def _get_selected_issue(self) -> dict[str, Any] | None:
         """Get the currently selected issue."""
-        # Check errors list first
-        errors_list = self.query_one("#errors-list", ListView)
-        if errors_list.highlighted_child is not None:
-            item = errors_list.highlighted_child
-            if isinstance(item, IssueListItem):
-                return item.issue
-
-        # Check warnings list
-        warnings_list = self.query_one("#warnings-list", ListView)
-        if warnings_list.highlighted_child is not None:
-            item = warnings_list.highlighted_child
-            if isinstance(item, IssueListItem):
-                return item.issue
+        errors_table = self.query_one("#errors-table", DataTable)
+        warnings_table = self.query_one("#warnings-table", DataTable)
+
+        # Prefer the focused table, then errors, then warnings
+        candidates = [
+            (errors_table, self._errors_by_row),
+            (warnings_table, self._warnings_by_row),
+        ]
+        if warnings_table.has_focus:
+            candidates.reverse()
+
+        for table, issues in candidates:
+            row = table.cursor_row
+            if issues and 0 <= row < len(issues):
+                return issues[row]
 
         return None
 
@@ -211,8 +207,6 @@ class AuditScreen(Screen[None]):
 
     def action_open_repo(self) -> None:
         """Open selected repository in browser."""
-        import webbrowser
-
         issue = self._get_selected_issue()
         if issue:
             repo_name = issue.get("repo", "")
@@ -220,8 +214,9 @@ class AuditScreen(Screen[None]):
                 url = f"https://github.com/{repo_name}"
             else:
                 url = f"https://github.com/{self.org_name}/{repo_name}"
-            webbrowser.open(url)
             self.app.notify(f"Opened {repo_name} in browser", timeout=2)
+            # Launching a browser can block, so keep it off the UI thread
+            threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
         else:
             self.app.notify("No issue selected", severity="warning", timeout=2)
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import cache
+
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
@@ -91,6 +94,12 @@ A terminal interface for managing GitHub repositories.
 """
 
 
+@cache
+def _help_renderable() -> Text:
+    """Parse HELP_TEXT markup once and reuse it for every help screen."""
+    return Text.from_markup(HELP_TEXT)
+
+
 class HelpScreen(ModalScreen[None]):
     """Modal help screen with keybindings and features."""
 
@@ -104,7 +113,7 @@ class HelpScreen(ModalScreen[None]):
         yield Vertical(
             Static("Help", classes="help-title"),
             VerticalScroll(
-                Static(HELP_TEXT, classes="help-content", markup=True),
+                Static(_help_renderable(), classes="help-content"),
                 id="help-scroll",
             ),
             classes="help-container",
@@ -2,41 +2,47 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import Screen
-from textual.widgets import Input, Label, ListItem, ListView, Static
+from textual.widgets import Input, Static
+from textual.worker import Worker, WorkerState
+
+from gh_toolkit.tui.screens.org import OrgScreen
+from gh_toolkit.tui.screens.results import ResultsScreen
+from gh_toolkit.tui.widgets.action_executor import ActionExecutor
+from gh_toolkit.tui.widgets.action_modal import ActionModal
+from gh_toolkit.tui.widgets.virtual_list import VirtualList
 
 if TYPE_CHECKING:
     from gh_toolkit.tui.app import GhToolkitApp
 
+# Concurrent org repo fetches when gathering targets for bulk actions
+ORG_FETCH_WORKERS = 8
 
-class OrgListItem(ListItem):
-    """A list item representing an organization."""
+# Row prefixes, so rendering a row is a single concatenation
+_CHECKED = "[x] "
+_UNCHECKED = "[ ] "
 
-    def __init__(self, org_data: dict[str, Any], selected: bool = False) -> None:
-        super().__init__()
-        self.org_data = org_data
-        self.selected = selected
 
-    def compose(self) -> ComposeResult:
-        """Compose the org list item."""
-        login = self.org_data.get("login", "Unknown")
-        description = self.org_data.get("description", "") or ""
+def format_org_display(org: dict[str, Any]) -> str:
+    """Build the list row text for an organization (without checkbox)."""
+    login = org.get("login", "Unknown")
+    description = org.get("description", "") or ""
 
-        # Truncate description if too long
-        if len(description) > 45:
-            description = description[:42] + "..."
+    # Truncate description if too long
+    if len(description) > 45:
+        description = description[:42] + "..."
 
-        checkbox = "[x]" if self.selected else "[ ]"
-        display = f"{checkbox} {login}"
-        if description:
-            display = f"{checkbox} {login} - {description}"
-
-        yield Label(display)
+    if description:
+        return f"{login} - {description}"
+    return login
 
 
 class HomeScreen(Screen[None]):
@@ -57,8 +63,13 @@ class HomeScreen(Screen[None]):
         super().__init__()
         self._orgs: list[dict[str, Any]] = []
         self._filtered_orgs: list[dict[str, Any]] = []
-        self._selected_orgs: set[str] = set()  # Set of org login names
+        # Selection bitmask: bit i is set when the org at _org_index position i is selected
+        self._org_index: dict[str, int] = {}
+        self._selected_mask = 0
         self._search_active = False
+        self._last_query: str | None = None  # Query behind _filtered_orgs
+        self._stats_dirty = False  # Stats bar update pending for next refresh
+        self._pending_scope_desc = ""
 
     @property
     def app(self) -> GhToolkitApp:
@@ -67,11 +78,17 @@ class HomeScreen(Screen[None]):
 
     def compose(self) -> ComposeResult:
         """Compose the home screen."""
+        # Keep references so handlers don't query the DOM on every key press
+        self._search_input = Input(
+            placeholder="Search organizations...", id="search-input", classes="search-input hidden"
+        )
+        self._stats_bar = Static("Loading...", id="stats-bar", classes="stats-bar")
+        self._list_view = VirtualList(self._format_org_row, id="org-list", classes="org-list")
         yield Vertical(
             Static("Organizations", classes="screen-title"),
-            Input(placeholder="Search organizations...", id="search-input", classes="search-input hidden"),
-            Static("Loading...", id="stats-bar", classes="stats-bar"),
-            ListView(id="org-list", classes="org-list"),
+            self._search_input,
+            self._stats_bar,
+            self._list_view,
             classes="content",
         )
 
@@ -81,127 +98,169 @@ class HomeScreen(Screen[None]):
 
     def load_organizations(self) -> None:
         """Load organizations from GitHub API."""
-        list_view = self.query_one("#org-list", ListView)
-        stats_bar = self.query_one("#stats-bar", Static)
-        search_input = self.query_one("#search-input", Input)
-
-        list_view.clear()
-        stats_bar.update("Loading organizations...")
+        self._show_orgs([])
+        self._last_query = None
+        self._stats_bar.update("Loading organizations...")
 
         try:
             self._orgs = self.app.get_organizations()
 
             if not self._orgs:
-                stats_bar.update("No organizations found")
+                self._stats_bar.update("No organizations found")
                 return
 
+            # Lowercase each login once for sorting, searching and selection keys
+            for org in self._orgs:
+                org["_login_lc"] = org.get("login", "").lower()
+
             # Sort by login name
-            self._orgs.sort(key=lambda x: x.get("login", "").lower())
+            self._orgs.sort(key=itemgetter("_login_lc"))
+
+            # Re-key the selection bitmask to the new org positions
+            selected_logins = self._selected_logins()
+            self._org_index = {
+                org["_login_lc"]: idx for idx, org in enumerate(self._orgs)
+            }
+            self._selected_mask = 0
+            for login in selected_logins:
+                idx = self._org_index.get(login)
+                if idx is not None:
+                    self._selected_mask |= 1 << idx
+
+            # Precompute row text once instead of on every row render
+            for org in self._orgs:
+                org["_display"] = format_org_display(org)
 
             # Apply any existing search filter
-            self._filter_orgs(search_input.value if self._search_active else "")
+            self._filter_orgs(self._search_input.value if self._search_active else "")
 
             # Focus the list
-            list_view.focus()
+            self._list_view.focus()
 
         except Exception as e:
-            stats_bar.update(f"Error: {e}")
+            self._stats_bar.update(f"Error: {e}")
+
+    def _org_bit(self, org: dict[str, Any]) -> int:
+        """Get the selection bitmask bit for an organization (0 if unknown)."""
+        idx = self._org_index.get(org.get("_login_lc", ""))
+        return 0 if idx is None else 1 << idx
 
     def _is_selected(self, org: dict[str, Any]) -> bool:
         """Check if an organization is selected."""
-        return org.get("login", "") in self._selected_orgs
+        return bool(self._selected_mask & self._org_bit(org))
+
+    def _selected_logins(self) -> list[str]:
+        """Get the lowercased login names of all selected organizations."""
+        mask = self._selected_mask
+        return [login for login, idx in self._org_index.items() if (mask >> idx) & 1]
 
     def action_select_org(self) -> None:
         """Select the highlighted organization."""
-        list_view = self.query_one("#org-list", ListView)
-
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, OrgListItem):
-                from gh_toolkit.tui.screens.org import OrgScreen
-
-                self.app.push_screen(OrgScreen(item.org_data))
+        org = self._list_view.highlighted_row
+        if org is not None:
+            self.app.push_screen(OrgScreen(org))
 
     def action_toggle_selection(self) -> None:
         """Toggle selection of highlighted item."""
-        list_view = self.query_one("#org-list", ListView)
-
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, OrgListItem):
-                org_name = item.org_data.get("login", "")
-                if org_name in self._selected_orgs:
-                    self._selected_orgs.remove(org_name)
-                    item.selected = False
-                else:
-                    self._selected_orgs.add(org_name)
-                    item.selected = True
-                item.refresh()
-                self._update_stats_bar()
+        org = self._list_view.highlighted_row
+        if org is not None:
+            self._selected_mask ^= self._org_bit(org)
+            self._list_view.refresh_rows()
+            self._update_stats_bar()
 
     def action_select_all(self) -> None:
         """Select all visible organizations."""
-        list_view = self.query_one("#org-list", ListView)
         orgs = self._filtered_orgs if self._filtered_orgs else self._orgs
 
         for org in orgs:
-            self._selected_orgs.add(org.get("login", ""))
+            self._selected_mask |= self._org_bit(org)
 
-        # Update all list items
-        for child in list_view.children:
-            if isinstance(child, OrgListItem):
-                child.selected = True
-                child.refresh()
+        # Rows read selection state at render time, so one repaint is enough
+        self._list_view.refresh_rows()
 
         self._update_stats_bar()
         self.app.notify(f"Selected {len(orgs)} organizations", timeout=2)
 
     def action_deselect_all(self) -> None:
         """Deselect all organizations."""
-        list_view = self.query_one("#org-list", ListView)
-        self._selected_orgs.clear()
+        self._selected_mask = 0
 
-        # Update all list items
-        for child in list_view.children:
-            if isinstance(child, OrgListItem):
-                child.selected = False
-                child.refresh()
+        # Rows read selection state at render time, so one repaint is enough
+        self._list_view.refresh_rows()
 
         self._update_stats_bar()
         self.app.notify("Cleared selection", timeout=2)
 
     def action_open_actions(self) -> None:
         """Open the actions modal for bulk operations across orgs."""
-        from gh_toolkit.tui.widgets.action_modal import ActionModal
-
         # Determine which orgs to process
-        if self._selected_orgs:
-            target_orgs = [
-                org for org in (self._filtered_orgs if self._filtered_orgs else self._orgs)
-                if org.get("login", "") in self._selected_orgs
-            ]
+        visible_orgs = self._filtered_orgs if self._filtered_orgs else self._orgs
+        if self._selected_mask:
+            target_orgs = [org for org in visible_orgs if self._is_selected(org)]
             scope_desc = f"repos in {len(target_orgs)} selected orgs"
         else:
-            target_orgs = self._filtered_orgs if self._filtered_orgs else self._orgs
+            target_orgs = visible_orgs
             scope_desc = f"repos in {len(target_orgs)} orgs"
 
         if not target_orgs:
             self.app.notify("No organizations to act on", severity="warning", timeout=2)
             return
 
-        # Gather all repos from selected/visible orgs
-        all_repos: list[tuple[str, str]] = []
+        # Gather all repos from selected/visible orgs in a background worker
+        self._pending_scope_desc = scope_desc
         self.app.notify("Loading repositories from organizations...", timeout=2)
 
-        for org in target_orgs:
-            org_name = org.get("login", "")
+        org_names = [org.get("login", "") for org in target_orgs]
+        self.run_worker(
+            partial(self._gather_org_repos, org_names),
+            name="gather_org_repos",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _gather_org_repos(self, org_names: list[str]) -> list[tuple[str, str]]:
+        """Fetch repositories for several orgs concurrently (runs in worker)."""
+        total = len(org_names)
+
+        def fetch(org_name: str) -> list[dict[str, Any]]:
             try:
-                repos = self.app.get_org_repos(org_name)
-                for repo in repos:
-                    all_repos.append((org_name, repo.get("name", "")))
+                return self.app.get_org_repos(org_name)
             except Exception:
-                pass  # Skip orgs we can't access
+                return []  # Skip orgs we can't access
 
+        all_repos: list[tuple[str, str]] = []
+        with ThreadPoolExecutor(max_workers=ORG_FETCH_WORKERS) as pool:
+            for done, (org_name, repos) in enumerate(
+                zip(org_names, pool.map(fetch, org_names), strict=True), start=1
+            ):
+                all_repos.extend((org_name, repo.get("name", "")) for repo in repos)
+                self.app.call_from_thread(
+                    self._stats_bar.update,
+                    f"Loading repositories... ({done}/{total} orgs)",
+                )
+
+        return all_repos
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Handle worker state changes."""
+        if event.worker.name == "execute_actions":  # type: ignore[union-attr]
+            if event.state == WorkerState.SUCCESS:
+                self.app.push_screen(ResultsScreen(event.worker.result or []))  # type: ignore[union-attr]
+            elif event.state == WorkerState.ERROR:
+                error_msg = str(event.worker.error or "Unknown error")  # type: ignore[union-attr]
+                self.app.notify(f"Error: {error_msg}", severity="error", timeout=3)
+        elif event.worker.name == "gather_org_repos":  # type: ignore[union-attr]
+            if event.state == WorkerState.SUCCESS:
+                self._update_stats_bar()
+                all_repos: list[tuple[str, str]] = event.worker.result or []  # type: ignore[union-attr]
+                self._show_action_modal(all_repos)
+            elif event.state == WorkerState.ERROR:
+                self._update_stats_bar()
+                error_msg = str(event.worker.error or "Unknown error")  # type: ignore[union-attr]
+                self.app.notify(f"Error: {error_msg}", severity="error", timeout=3)
+
+    def _show_action_modal(self, all_repos: list[tuple[str, str]]) -> None:
+        """Push the actions modal for the gathered repositories."""
         if not all_repos:
             self.app.notify("No repositories found in selected organizations", severity="warning", timeout=2)
             return
@@ -210,25 +269,23 @@ class HomeScreen(Screen[None]):
             if result is not None:
                 self._execute_actions(result)
 
-        self.app.push_screen(ActionModal(all_repos, scope_desc), handle_result)
+        self.app.push_screen(ActionModal(all_repos, self._pending_scope_desc), handle_result)
 
     def _execute_actions(self, action_result: Any) -> None:
-        """Execute the selected actions."""
-        from gh_toolkit.tui.screens.results import ResultsScreen
-        from gh_toolkit.tui.widgets.action_executor import ActionExecutor
-
-        executor = ActionExecutor()
-        results = executor.execute(action_result)
-
-        # Show results
-        self.app.push_screen(ResultsScreen(results))
+        """Execute the selected actions in a worker."""
+        self.app.notify("Running actions...", timeout=2)
+        # Actions make many blocking API calls, so keep them off the event loop
+        self.run_worker(
+            partial(ActionExecutor().execute, action_result),
+            name="execute_actions",
+            group="actions",
+            exclusive=True,
+            thread=True,
+        )
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_virtual_list_selected(self, event: VirtualList.Selected) -> None:
         """Handle list item selection."""
-        if isinstance(event.item, OrgListItem):
-            from gh_toolkit.tui.screens.org import OrgScreen
-
-            self.app.push_screen(OrgScreen(event.item.org_data))
+        self.app.push_screen(OrgScreen(event.row))
 
     def refresh_data(self) -> None:
         """Refresh organizations data."""
@@ -236,18 +293,16 @@ class HomeScreen(Screen[None]):
 
     def action_toggle_search(self) -> None:
         """Toggle the search input visibility."""
-        search_input = self.query_one("#search-input", Input)
-        if search_input.has_class("hidden"):
-            search_input.remove_class("hidden")
-            search_input.focus()
+        if self._search_input.has_class("hidden"):
+            self._search_input.remove_class("hidden")
+            self._search_input.focus()
             self._search_active = True
         else:
-            search_input.add_class("hidden")
-            search_input.value = ""
+            self._search_input.add_class("hidden")
+            self._search_input.value = ""
             self._search_active = False
             self._filter_orgs("")
-            list_view = self.query_one("#org-list", ListView)
-            list_view.focus()
+            self._list_view.focus()
 
     def action_cancel_or_quit(self) -> None:
         """Cancel search or quit the app."""
@@ -265,38 +320,63 @@ class HomeScreen(Screen[None]):
         """Handle search input submission."""
         if event.input.id == "search-input":
             # Focus the list and select first item
-            list_view = self.query_one("#org-list", ListView)
-            list_view.focus()
+            self._list_view.focus()
 
     def _filter_orgs(self, query: str) -> None:
         """Filter organizations based on search query."""
-        list_view = self.query_one("#org-list", ListView)
-
-        list_view.clear()
-
         if not self._orgs:
+            self._show_orgs([])
             return
 
-        # Filter orgs by login or description
+        # Filter orgs by login or description. An unchanged query needs no
+        # rebuild, and one that extends the previous query can only match a
+        # subset, so narrow the previous results instead.
         query_lower = query.lower()
-        self._filtered_orgs = [
-            org for org in self._orgs
-            if query_lower in org.get("login", "").lower()
-            or query_lower in (org.get("description") or "").lower()
-        ]
+        if query_lower == self._last_query and self._filtered_orgs:
+            return
+        if not query_lower:
+            # Everything matches an empty query
+            self._filtered_orgs = self._orgs
+        else:
+            if self._last_query is not None and query_lower.startswith(self._last_query):
+                candidates = self._filtered_orgs
+            else:
+                candidates = self._orgs
+            self._filtered_orgs = [
+                org for org in candidates
+                if query_lower in org["_login_lc"]
+                or query_lower in (org.get("description") or "").lower()
+            ]
+        self._last_query = query_lower
 
         # Populate list with selection state
-        for org in self._filtered_orgs:
-            is_selected = self._is_selected(org)
-            list_view.append(OrgListItem(org, selected=is_selected))
+        self._show_orgs(self._filtered_orgs)
 
         self._update_stats_bar()
 
+    def _show_orgs(self, orgs: list[dict[str, Any]]) -> None:
+        """Show orgs in the list; rows are rendered on demand."""
+        self._list_view.set_rows(orgs)
+
+    def _format_org_row(self, org: dict[str, Any]) -> str:
+        """Get the list row text for an organization."""
+        return (_CHECKED if self._is_selected(org) else _UNCHECKED) + org["_display"]
+
     def _update_stats_bar(self) -> None:
+        """Schedule a stats bar update, coalescing repeated calls into one."""
+        if self._stats_dirty:
+            return
+        self._stats_dirty = True
+        self.call_after_refresh(self._flush_stats_bar)
+
+    def _flush_stats_bar(self) -> None:
         """Update the stats bar with current info."""
-        stats_bar = self.query_one("#stats-bar", Static)
+        if not self._stats_dirty:
+            return
+        self._stats_dirty = False
+
         orgs = self._filtered_orgs if self._filtered_orgs else self._orgs
-        selected_count = len(self._selected_orgs)
+        selected_count = self._selected_mask.bit_count()
 
         parts = []
 
@@ -308,4 +388,4 @@ class HomeScreen(Screen[None]):
         if selected_count > 0:
             parts.append(f"[bold cyan]{selected_count} selected[/bold cyan]")
 
-        stats_bar.update("  ".join(parts))
+        self._stats_bar.update("  ".join(parts))
@@ -2,49 +2,104 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import Screen
-from textual.widgets import Input, Label, ListItem, ListView, Static
+from textual.timer import Timer
+from textual.widgets import Input, Static
+from textual.worker import Worker, WorkerState
+
+from gh_toolkit.core.github_client import GitHubAPIError
+from gh_toolkit.tui.screens.preview import PreviewScreen
+from gh_toolkit.tui.screens.repo import RepoScreen
+from gh_toolkit.tui.screens.results import ResultsScreen
+from gh_toolkit.tui.widgets.action_executor import ActionExecutor
+from gh_toolkit.tui.widgets.action_modal import ActionModal
+from gh_toolkit.tui.widgets.virtual_list import VirtualList
 
 if TYPE_CHECKING:
     from gh_toolkit.tui.app import GhToolkitApp
 
+# Delay before a search keystroke rebuilds the list, so fast typing filters once
+SEARCH_DEBOUNCE_SECONDS = 0.12
+
+# Presses of sort/refresh closer together than this are coalesced (held keys)
+KEY_REPEAT_DEBOUNCE_SECONDS = 0.15
+
+# Row prefixes, so rendering a row is a single concatenation
+_CHECKED = "[x] "
+_UNCHECKED = "[ ] "
+
+# Sort key and direction for each sort option
+_SORT_KEYS = {
+    "stars": (attrgetter("stars"), True),
+    "name": (attrgetter("name_lower"), False),
+    "updated": (attrgetter("updated_at"), True),
+}
+
+
+def format_repo_display(repo: dict[str, Any]) -> str:
+    """Build the list row text for a repository (without checkbox)."""
+    name = repo.get("name", "Unknown")
+    stars = repo.get("stargazers_count", 0)
+    language = repo.get("language") or "—"
+    description = repo.get("description", "") or ""
+
+    # Truncate description
+    if len(description) > 35:
+        description = description[:32] + "..."
+
+    # Format: name  ⭐ N  Language  Description
+    star_display = f"⭐{stars}" if stars > 0 else "   "
+
+    return f"{name:<18} {star_display:>4}  {language:<10} {description}"
+
+
+@dataclass(slots=True)
+class RepoRow:
+    """A repository list row with the fields the screen reads unpacked."""
+
+    name: str
+    name_lower: str
+    stars: int
+    language: str
+    updated_at: str
+    search_key: str  # "name\0description", lowercased
+    display: str  # Row text without the checkbox
+    raw: dict[str, Any]  # API data, passed on to other screens
+
+    @classmethod
+    def from_api(cls, repo: dict[str, Any]) -> RepoRow:
+        """Build a row from GitHub API repository data."""
+        name = repo.get("name") or ""
+        name_lower = name.lower()
+        return cls(
+            name=name,
+            name_lower=name_lower,
+            stars=repo.get("stargazers_count") or 0,
+            language=repo.get("language") or "",
+            updated_at=repo.get("updated_at") or "",
+            search_key=f"{name_lower}\x00{(repo.get('description') or '').lower()}",
+            display=format_repo_display(repo),
+            raw=repo,
+        )
 
-class RepoListItem(ListItem):
-    """A list item representing a repository."""
-
-    def __init__(self, repo_data: dict[str, Any], selected: bool = False) -> None:
-        super().__init__()
-        self.repo_data = repo_data
-        self.selected = selected
-
-    def compose(self) -> ComposeResult:
-        """Compose the repo list item."""
-        name = self.repo_data.get("name", "Unknown")
-        stars = self.repo_data.get("stargazers_count", 0)
-        language = self.repo_data.get("language") or "—"
-        description = self.repo_data.get("description", "") or ""
-
-        # Truncate description
-        if len(description) > 35:
-            description = description[:32] + "..."
-
-        # Format: [x] name  ⭐ N  Language  Description
-        star_display = f"⭐{stars}" if stars > 0 else "   "
-        checkbox = "[x]" if self.selected else "[ ]"
-
-        display = f"{checkbox} {name:<18} {star_display:>4}  {language:<10} {description}"
-        yield Label(display)
 
-    def toggle_selection(self) -> None:
-        """Toggle the selection state."""
-        self.selected = not self.selected
-        # Refresh the display
-        self.refresh()
+def _count_stats(rows: list[RepoRow], languages: set[str]) -> int:
+    """Add the rows' languages to ``languages`` and return their total stars."""
+    total_stars = 0
+    for row in rows:
+        total_stars += row.stars
+        if row.language:
+            languages.add(row.language)
+    return total_stars
 
 
 class OrgScreen(Screen[None]):
@@ -67,11 +122,30 @@ class OrgScreen(Screen[None]):
         super().__init__()
         self.org_data = org_data
         self.org_name = org_data.get("login", "Unknown")
-        self._repos: list[dict[str, Any]] = []
-        self._filtered_repos: list[dict[str, Any]] = []
-        self._selected_repos: set[str] = set()  # Set of "owner/repo" strings
+        self._repos: list[RepoRow] = []
+        self._filtered_repos: list[RepoRow] = []
+        self._selected_repos: set[str] = set()  # Repo names (owner is always org_name)
         self._sort_by = "stars"  # stars, name, updated
+        # Fetched repos in each sort order, built once per fetch
+        self._sorted_views: dict[str, list[RepoRow]] = {}
         self._search_active = False
+        self._last_query: str | None = None  # Query behind _filtered_repos
+        self._filter_timer: Timer | None = None
+        self._last_sort_time = 0.0
+        self._sort_timer: Timer | None = None
+        self._last_refresh_time = 0.0
+        self._refresh_timer: Timer | None = None
+        # Bumped by each fetch, so pages from a replaced fetch are dropped
+        self._fetch_generation = 0
+        self._fetch_worker: Worker[list[dict[str, Any]]] | None = None
+        # Whether every page of the current fetch has arrived
+        self._fetch_complete = False
+        # Stats for the displayed repos, recomputed when the list changes
+        self._stats_total_stars = 0
+        self._stats_languages: set[str] = set()
+        # Stats for all fetched repos, updated as each page arrives
+        self._org_total_stars = 0
+        self._org_languages: set[str] = set()
 
     @property
     def app(self) -> GhToolkitApp:
@@ -80,11 +154,17 @@ class OrgScreen(Screen[None]):
 
     def compose(self) -> ComposeResult:
         """Compose the organization screen."""
+        # Keep references so handlers don't query the DOM on every key press
+        self._search_input = Input(
+            placeholder="Search repositories...", id="search-input", classes="search-input hidden"
+        )
+        self._stats_bar = Static("Loading...", id="stats-bar", classes="stats-bar")
+        self._list_view = VirtualList(self._format_repo_row, id="repo-list", classes="repo-list")
         yield Vertical(
             Static(f"← {self.org_name}", classes="screen-title"),
-            Input(placeholder="Search repositories...", id="search-input", classes="search-input hidden"),
-            Static("Loading...", id="stats-bar", classes="stats-bar"),
-            ListView(id="repo-list", classes="repo-list"),
+            self._search_input,
+            self._stats_bar,
+            self._list_view,
             classes="content",
         )
 
@@ -94,123 +174,165 @@ class OrgScreen(Screen[None]):
 
     def load_repositories(self) -> None:
         """Load repositories for this organization."""
-        list_view = self.query_one("#repo-list", ListView)
-        stats_bar = self.query_one("#stats-bar", Static)
-        search_input = self.query_one("#search-input", Input)
-
-        list_view.clear()
-        stats_bar.update("Loading repositories...")
-
-        try:
-            self._repos = self.app.get_org_repos(self.org_name)
+        self._list_view.set_rows([])
+        self._repos = []
+        self._filtered_repos = []
+        self._sorted_views = {sort_by: [] for sort_by in _SORT_KEYS}
+        self._org_total_stars = 0
+        self._org_languages = set()
+        self._last_query = None
+        self._fetch_generation += 1
+        self._fetch_complete = False
+        self._stats_bar.update("Loading repositories...")
+
+        # Fetch in a background worker so pagination doesn't block input. API
+        # and network errors are shown in on_worker_state_changed, not fatal.
+        self._fetch_worker = self.run_worker(
+            partial(self._fetch_repos, self._fetch_generation),
+            name="fetch_repos",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
 
-            if not self._repos:
-                stats_bar.update("No repositories found")
+    def _fetch_repos(self, generation: int) -> list[dict[str, Any]]:
+        """Fetch repositories for this organization (runs in worker)."""
+
+        def receive_page(repos: list[dict[str, Any]]) -> None:
+            # Show each page as it arrives; the UI thread drops stale pages
+            self.app.call_from_thread(self._add_repositories, repos, generation)
+
+        return self.app.get_org_repos(self.org_name, on_page=receive_page)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Handle worker state changes."""
+        if event.worker.name == "execute_actions":  # type: ignore[union-attr]
+            if event.state == WorkerState.SUCCESS:
+                self.app.push_screen(ResultsScreen(event.worker.result or []))  # type: ignore[union-attr]
+            elif event.state == WorkerState.ERROR:
+                error_msg = str(event.worker.error or "Unknown error")  # type: ignore[union-attr]
+                self.app.notify(f"Error: {error_msg}", severity="error", timeout=3)
+        elif event.worker.name == "fetch_repos":  # type: ignore[union-attr]
+            if event.worker is not self._fetch_worker:
+                # A refresh has replaced this fetch
                 return
+            if event.state == WorkerState.SUCCESS:
+                self._fetch_complete = True
+                # Pages were already added as they arrived
+                if not self._repos:
+                    self._stats_bar.update("No repositories found")
+                    return
+                self._list_view.focus()
+            elif event.state == WorkerState.ERROR:
+                # Transient failures were already retried by the client
+                error = event.worker.error  # type: ignore[union-attr]
+                if isinstance(error, GitHubAPIError) and error.status_code == 401:
+                    self._stats_bar.update("Error: authentication failed, check GITHUB_TOKEN")
+                else:
+                    self._stats_bar.update(f"Error: {error or 'Unknown error'}")
 
-            # Sort repos
-            self._sort_repos()
-
-            # Apply any existing search filter
-            self._filter_repos(search_input.value if self._search_active else "")
+    def _add_repositories(self, repos: list[dict[str, Any]], generation: int) -> None:
+        """Merge a page of fetched repositories into the sorted views and list."""
+        if generation != self._fetch_generation:
+            # The page belongs to a fetch that a refresh has since replaced
+            return
+        # Read before the views change, as the list may be showing one of them
+        highlighted = self._list_view.highlighted_row
+        # Row text and search keys are built once per fetch, not per render
+        rows = [RepoRow.from_api(repo) for repo in repos]
+        self._org_total_stars += _count_stats(rows, self._org_languages)
+        for sort_by, (key, reverse) in _SORT_KEYS.items():
+            view = self._sorted_views[sort_by]
+            # With the page sorted first the view is two sorted runs, which
+            # Timsort merges in linear time
+            view.extend(sorted(rows, key=key, reverse=reverse))
+            view.sort(key=key, reverse=reverse)
+
+        # Keep the user's place while later pages stream in
+        self._rebuild_list(keep_row=highlighted)
+
+    def _rebuild_list(self, keep_row: RepoRow | None = None) -> None:
+        """Show the fetched repositories in the current order and filter."""
+        self._sort_repos()
+        self._last_query = None
+
+        # Apply any existing search filter
+        self._filter_repos(
+            self._search_input.value if self._search_active else "", keep_row
+        )
 
-            # Focus the list
-            list_view.focus()
+    def _sort_repos(self) -> None:
+        """Switch to the precomputed view for the current sort setting."""
+        self._repos = self._sorted_views[self._sort_by]
 
-        except Exception as e:
-            stats_bar.update(f"Error: {e}")
+    def _get_repo_key(self, repo: RepoRow) -> str:
+        """Get unique key for a repository within this organization."""
+        return repo.name
 
-    def _sort_repos(self) -> None:
-        """Sort repositories based on current sort setting."""
-        if self._sort_by == "stars":
-            self._repos.sort(key=lambda x: x.get("stargazers_count", 0), reverse=True)
-        elif self._sort_by == "name":
-            self._repos.sort(key=lambda x: x.get("name", "").lower())
-        elif self._sort_by == "updated":
-            self._repos.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
-
-    def _get_repo_key(self, repo: dict[str, Any]) -> str:
-        """Get unique key for a repository."""
-        return f"{self.org_name}/{repo.get('name', '')}"
-
-    def _is_selected(self, repo: dict[str, Any]) -> bool:
+    def _is_selected(self, repo: RepoRow) -> bool:
         """Check if a repository is selected."""
         return self._get_repo_key(repo) in self._selected_repos
 
+    def _format_repo_row(self, repo: RepoRow) -> str:
+        """Get the list row text for a repository."""
+        # Only the checkbox changes between renders; the rest is built at load
+        return (_CHECKED if self._is_selected(repo) else _UNCHECKED) + repo.display
+
     def action_select_repo(self) -> None:
         """View the highlighted repository."""
-        list_view = self.query_one("#repo-list", ListView)
-
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, RepoListItem):
-                from gh_toolkit.tui.screens.repo import RepoScreen
-
-                self.app.push_screen(RepoScreen(item.repo_data, self.org_name))
+        repo = self._list_view.highlighted_row
+        if repo is not None:
+            self.app.push_screen(RepoScreen(repo.raw, self.org_name))
 
     def action_toggle_selection(self) -> None:
         """Toggle selection of highlighted item."""
-        list_view = self.query_one("#repo-list", ListView)
-
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, RepoListItem):
-                repo_key = self._get_repo_key(item.repo_data)
-                if repo_key in self._selected_repos:
-                    self._selected_repos.remove(repo_key)
-                    item.selected = False
-                else:
-                    self._selected_repos.add(repo_key)
-                    item.selected = True
-                item.refresh()
-                self._update_stats_bar()
+        repo = self._list_view.highlighted_row
+        if repo is not None:
+            repo_key = self._get_repo_key(repo)
+            if repo_key in self._selected_repos:
+                self._selected_repos.remove(repo_key)
+            else:
+                self._selected_repos.add(repo_key)
+            self._list_view.refresh_rows()
+            self._update_stats_bar()
 
     def action_select_all(self) -> None:
         """Select all visible repositories."""
-        list_view = self.query_one("#repo-list", ListView)
         repos = self._filtered_repos if self._filtered_repos else self._repos
 
         for repo in repos:
             self._selected_repos.add(self._get_repo_key(repo))
 
-        # Update all list items
-        for child in list_view.children:
-            if isinstance(child, RepoListItem):
-                child.selected = True
-                child.refresh()
+        # Rows read selection state at render time, so one repaint is enough
+        self._list_view.refresh_rows()
 
         self._update_stats_bar()
         self.app.notify(f"Selected {len(repos)} repositories", timeout=2)
 
     def action_deselect_all(self) -> None:
         """Deselect all repositories."""
-        list_view = self.query_one("#repo-list", ListView)
         self._selected_repos.clear()
 
-        # Update all list items
-        for child in list_view.children:
-            if isinstance(child, RepoListItem):
-                child.selected = False
-                child.refresh()
+        # Rows read selection state at render time, so one repaint is enough
+        self._list_view.refresh_rows()
 
         self._update_stats_bar()
         self.app.notify("Cleared selection", timeout=2)
 
     def action_open_actions(self) -> None:
         """Open the actions modal."""
-        from gh_toolkit.tui.widgets.action_modal import ActionModal
-
         # Determine scope: selected repos or all visible repos
         if self._selected_repos:
+            selected = self._selected_repos
             repos = [
-                (self.org_name, repo.get("name", ""))
+                (self.org_name, name)
                 for repo in (self._filtered_repos if self._filtered_repos else self._repos)
-                if self._get_repo_key(repo) in self._selected_repos
+                if (name := repo.name) in selected
             ]
             scope_desc = f"selected in {self.org_name}"
         else:
             repos_list = self._filtered_repos if self._filtered_repos else self._repos
-            repos = [(self.org_name, repo.get("name", "")) for repo in repos_list]
+            repos = [(self.org_name, repo.name) for repo in repos_list]
             scope_desc = f"repos in {self.org_name}"
 
         if not repos:
@@ -224,22 +346,20 @@ class OrgScreen(Screen[None]):
         self.app.push_screen(ActionModal(repos, scope_desc), handle_result)
 
     def _execute_actions(self, action_result: Any) -> None:
-        """Execute the selected actions."""
-        from gh_toolkit.tui.screens.results import ResultsScreen
-        from gh_toolkit.tui.widgets.action_executor import ActionExecutor
-
-        executor = ActionExecutor()
-        results = executor.execute(action_result)
-
-        # Show results
-        self.app.push_screen(ResultsScreen(results))
+        """Execute the selected actions in a worker."""
+        self.app.notify("Running actions...", timeout=2)
+        # Actions make many blocking API calls, so keep them off the event loop
+        self.run_worker(
+            partial(ActionExecutor().execute, action_result),
+            name="execute_actions",
+            group="actions",
+            exclusive=True,
+            thread=True,
+        )
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_virtual_list_selected(self, event: VirtualList.Selected) -> None:
         """Handle list item double-click/enter."""
-        if isinstance(event.item, RepoListItem):
-            from gh_toolkit.tui.screens.repo import RepoScreen
-
-            self.app.push_screen(RepoScreen(event.item.repo_data, self.org_name))
+        self.app.push_screen(RepoScreen(event.row.raw, self.org_name))
 
     def action_cancel_or_back(self) -> None:
         """Cancel search or go back to home screen."""
@@ -253,79 +373,134 @@ class OrgScreen(Screen[None]):
         sort_options = ["stars", "name", "updated"]
         current_idx = sort_options.index(self._sort_by)
         self._sort_by = sort_options[(current_idx + 1) % len(sort_options)]
-        self.load_repositories()
+
+        # A press right after the previous one (held key) only updates the
+        # indicator; the list is rebuilt once the presses stop
+        now = time.monotonic()
+        if self._sort_timer is not None:
+            self._sort_timer.stop()
+            self._sort_timer = None
+        if now - self._last_sort_time < KEY_REPEAT_DEBOUNCE_SECONDS:
+            self._sort_timer = self.set_timer(KEY_REPEAT_DEBOUNCE_SECONDS, self._apply_sort)
+            if self._repos:
+                self._update_stats_bar()
+        else:
+            self._apply_sort()
+        self._last_sort_time = now
+
+    def _apply_sort(self) -> None:
+        """Show the list in the current sort order."""
+        self._sort_timer = None
+        # Only the order changes, so re-sort the fetched data without refetching
+        if self._repos:
+            self._rebuild_list()
 
     def refresh_data(self) -> None:
-        """Refresh repository data."""
+        """Refresh repository data, coalescing repeated requests."""
+        # A single press reloads right away; a press right after the previous
+        # one (held key) defers the reload until the presses stop
+        now = time.monotonic()
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+        if now - self._last_refresh_time < KEY_REPEAT_DEBOUNCE_SECONDS:
+            self._refresh_timer = self.set_timer(KEY_REPEAT_DEBOUNCE_SECONDS, self._reload)
+        else:
+            self._reload()
+        self._last_refresh_time = now
+
+    def _reload(self) -> None:
+        """Refetch repositories, bypassing the app's cache."""
+        self._refresh_timer = None
         # Clear cache for this org
         self.app.clear_org_cache(self.org_name)
         self.load_repositories()
 
     def action_generate_readme(self) -> None:
         """Generate README for this organization."""
-        from gh_toolkit.tui.screens.preview import PreviewScreen
-
-        self.app.push_screen(PreviewScreen(self.org_name, self.org_data))
+        # The generator renders the whole org, so the preview may only key its
+        # cache on the repo list once every page has arrived
+        repos = [repo.raw for repo in self._repos] if self._fetch_complete else None
+        self.app.push_screen(PreviewScreen(self.org_name, self.org_data, repos))
 
     def action_toggle_search(self) -> None:
         """Toggle the search input visibility."""
-        search_input = self.query_one("#search-input", Input)
-        if search_input.has_class("hidden"):
-            search_input.remove_class("hidden")
-            search_input.focus()
+        if self._search_input.has_class("hidden"):
+            self._search_input.remove_class("hidden")
+            self._search_input.focus()
             self._search_active = True
         else:
-            search_input.add_class("hidden")
-            search_input.value = ""
+            self._search_input.add_class("hidden")
+            self._cancel_filter_timer()
+            self._search_input.value = ""
             self._search_active = False
             self._filter_repos("")
-            list_view = self.query_one("#repo-list", ListView)
-            list_view.focus()
+            self._list_view.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
-        if event.input.id == "search-input":
-            self._filter_repos(event.value)
+        if event.input.id == "search-input" and self._search_active:
+            # Restart the debounce window on every keystroke
+            self._cancel_filter_timer()
+            self._filter_timer = self.set_timer(
+                SEARCH_DEBOUNCE_SECONDS, partial(self._filter_repos, event.value)
+            )
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission."""
         if event.input.id == "search-input":
-            # Focus the list and select first item
-            list_view = self.query_one("#repo-list", ListView)
-            list_view.focus()
+            # Apply any pending filter right away
+            if self._filter_timer is not None:
+                self._cancel_filter_timer()
+                self._filter_repos(event.value)
 
-    def _filter_repos(self, query: str) -> None:
-        """Filter repositories based on search query."""
-        list_view = self.query_one("#repo-list", ListView)
+            # Focus the list and select first item
+            self._list_view.focus()
 
-        list_view.clear()
+    def _cancel_filter_timer(self) -> None:
+        """Stop any pending debounced filter."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
 
+    def _filter_repos(self, query: str, keep_row: RepoRow | None = None) -> None:
+        """Filter repositories based on search query."""
         if not self._repos:
+            self._list_view.set_rows([])
             return
 
-        # Filter repos by name or description
+        # Filter repos by name or description; the list is already correct
+        # when the query hasn't changed since the last filter
         query_lower = query.lower()
-        self._filtered_repos = [
-            repo for repo in self._repos
-            if query_lower in repo.get("name", "").lower()
-            or query_lower in (repo.get("description") or "").lower()
-        ]
+        if query_lower == self._last_query and self._filtered_repos:
+            return
+        self._last_query = query_lower
+        if not query_lower:
+            # Everything matches an empty query
+            self._filtered_repos = self._repos
+        else:
+            self._filtered_repos = [
+                repo for repo in self._repos if query_lower in repo.search_key
+            ]
 
-        # Populate list with selection state
-        for repo in self._filtered_repos:
-            is_selected = self._is_selected(repo)
-            list_view.append(RepoListItem(repo, selected=is_selected))
+        # Rows are rendered on demand, selection state is read at render time
+        self._list_view.set_rows(self._filtered_repos, keep_row)
+
+        # Aggregate stats only change with the list, not with selection. The
+        # full list's stats are kept up to date as pages arrive.
+        if self._filtered_repos and self._filtered_repos is not self._repos:
+            self._stats_languages = set()
+            self._stats_total_stars = _count_stats(self._filtered_repos, self._stats_languages)
+        else:
+            self._stats_total_stars = self._org_total_stars
+            self._stats_languages = self._org_languages
 
         self._update_stats_bar()
 
     def _update_stats_bar(self) -> None:
         """Update the stats bar with current info."""
-        stats_bar = self.query_one("#stats-bar", Static)
         repos = self._filtered_repos if self._filtered_repos else self._repos
 
-        # Calculate stats
-        total_stars = sum(r.get("stargazers_count", 0) for r in repos)
-        languages = {r.get("language") for r in repos if r.get("language")}
         selected_count = len(self._selected_repos)
 
         # Build stats string
@@ -337,11 +512,11 @@ class OrgScreen(Screen[None]):
         else:
             parts.append(f"{len(repos)} repos")
 
-        parts.append(f"⭐{total_stars}")
-        parts.append(f"{len(languages)} lang")
+        parts.append(f"⭐{self._stats_total_stars}")
+        parts.append(f"{len(self._stats_languages)} lang")
         parts.append(f"Sort: {sort_indicator.get(self._sort_by, '')}")
 
         if selected_count > 0:
             parts.append(f"[bold cyan]{selected_count} selected[/bold cyan]")
 
-        stats_bar.update("  ".join(parts))
+        self._stats_bar.update("  ".join(parts))
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+from functools import cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
@@ -14,10 +17,30 @@ from textual.widgets import Static
 from textual.worker import Worker, WorkerState
 
 from gh_toolkit.core.readme_generator import OrgReadmeGenerator
+from gh_toolkit.tui.cache import CACHE_DIR, write_cache_file
 
 if TYPE_CHECKING:
     from gh_toolkit.tui.app import GhToolkitApp
 
+# Generated READMEs, keyed on the org, options and the state of its repos
+README_CACHE_DIR = CACHE_DIR / "readmes"
+
+
+@cache
+def _options_bar_text(template: str, grouping: str) -> Text:
+    """Build the options bar for a template/grouping pair (only a few exist)."""
+    # Plain Text, so "[default]" etc. aren't parsed as markup tags
+    return Text(
+        f"Template: [{template}]  Group by: [{grouping}]  "
+        f"| s Save | t Template | g Group | r Regenerate | Esc Back"
+    )
+
+
+def _write_readme(output_path: Path, content: str) -> Path:
+    """Write README content to disk (runs in worker)."""
+    output_path.write_text(content, encoding="utf-8")
+    return output_path
+
 
 class PreviewScreen(Screen[None]):
     """Screen for previewing and saving generated README."""
@@ -33,14 +56,23 @@ class PreviewScreen(Screen[None]):
     TEMPLATES = ["default", "minimal", "detailed"]
     GROUPINGS = ["category", "language", "topic"]
 
-    def __init__(self, org_name: str, org_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        org_name: str,
+        org_data: dict[str, Any],
+        repos: list[dict[str, Any]] | None = None,
+    ) -> None:
         super().__init__()
         self.org_name = org_name
         self.org_data = org_data
+        # The org's repos as already fetched by the caller; keys the README cache
+        self.repos = repos or []
         self._readme_content: str = ""
         self._template_idx = 0
         self._grouping_idx = 0
         self._is_generating = False
+        # (template, grouping) that produced _readme_content
+        self._generated_options: tuple[str, str] | None = None
 
     @property
     def app(self) -> GhToolkitApp:
@@ -77,29 +109,67 @@ class PreviewScreen(Screen[None]):
     def _update_options_bar(self) -> None:
         """Update the options display bar."""
         options_bar = self.query_one("#options-bar", Static)
-        options_bar.update(
-            f"Template: [{self.template}]  Group by: [{self.grouping}]  "
-            f"| s Save | t Template | g Group | r Regenerate | Esc Back"
-        )
+        options_bar.update(_options_bar_text(self.template, self.grouping))
 
-    def _generate_readme(self) -> None:
-        """Start README generation in a worker."""
+    def _generate_readme(self, force: bool = False) -> None:
+        """Start README generation in a worker (force skips the disk cache)."""
         if self._is_generating:
             return
 
         self._is_generating = True
         preview = self.query_one("#preview-content", Static)
         preview.update("Generating README...")
+        self._generated_options = (self.template, self.grouping)
 
+        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+        cache_path = self._readme_cache_path(self.template, self.grouping, bool(anthropic_key))
+
+        # The generator makes blocking API calls, so keep it off the event loop
         self.run_worker(
-            self._do_generate_readme,
+            partial(
+                self._do_generate_readme,
+                self.template,
+                self.grouping,
+                anthropic_key,
+                cache_path,
+                force,
+            ),
             name="generate_readme",
             exclusive=True,
+            thread=True,
         )
 
-    async def _do_generate_readme(self) -> str:
-        """Generate README content (runs in worker)."""
-        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+    def _readme_cache_path(self, template: str, grouping: str, use_ai: bool) -> Path | None:
+        """Get the cache file for these options and the org's current repos.
+
+        Repo ids and update times are part of the key, so an entry goes stale
+        as soon as any repo changes and is simply never looked up again.
+        Without the repos there is nothing to key on, so there is no cache file.
+        """
+        if not self.repos:
+            return None
+        repo_state = ",".join(
+            sorted(f"{r.get('id')}:{r.get('updated_at')}" for r in self.repos)
+        )
+        raw_key = f"{self.org_name}|{template}|{grouping}|{use_ai}|{repo_state}"
+        key = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+        return README_CACHE_DIR / f"{key}.md"
+
+    def _do_generate_readme(
+        self,
+        template: str,
+        grouping: str,
+        anthropic_key: str | None,
+        cache_path: Path | None,
+        force: bool,
+    ) -> str:
+        """Generate README content, reusing a cached copy if any (runs in worker)."""
+        if cache_path is not None and not force:
+            try:
+                return cache_path.read_text(encoding="utf-8")
+            except OSError:
+                pass
+
         generator = OrgReadmeGenerator(
             self.app.github_client,
             anthropic_api_key=anthropic_key,
@@ -109,14 +179,16 @@ class PreviewScreen(Screen[None]):
         try:
             content = generator.generate_readme(
                 self.org_name,
-                template=self.template,
-                group_by=self.grouping,
+                template=template,
+                group_by=grouping,
                 include_stats=True,
                 exclude_forks=True,
             )
-            return content
         except Exception as e:
             return f"Error generating README: {e}"
+        if cache_path is not None:
+            write_cache_file(cache_path, content)
+        return content
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker state changes."""
@@ -132,6 +204,20 @@ class PreviewScreen(Screen[None]):
                 error_msg = str(event.worker.error or "Unknown error")  # type: ignore[union-attr]
                 preview.update(f"Error: {error_msg}")
                 self._is_generating = False
+        elif event.worker.name == "save_readme":  # type: ignore[union-attr]
+            if event.state == WorkerState.SUCCESS:
+                output_path: Path = event.worker.result  # type: ignore[union-attr]
+                self.app.notify(
+                    f"Saved to {output_path.name}",
+                    title="README Saved",
+                    timeout=3,
+                )
+            elif event.state == WorkerState.ERROR:
+                self.app.notify(
+                    f"Failed to save: {event.worker.error}",  # type: ignore[union-attr]
+                    severity="error",
+                    timeout=3,
+                )
 
     def action_go_back(self) -> None:
         """Go back to organization screen."""
@@ -153,7 +239,8 @@ class PreviewScreen(Screen[None]):
         """Regenerate README with current options."""
         if not self._is_generating:
             self.app.notify("Regenerating README...", timeout=1)
-            self._generate_readme()
+            # Unchanged options mean the user wants a fresh copy, not the cached one
+            self._generate_readme(force=self._generated_options == (self.template, self.grouping))
 
     def action_save(self) -> None:
         """Save README to file."""
@@ -164,16 +251,12 @@ class PreviewScreen(Screen[None]):
         # Default output path
         output_path = Path.cwd() / f"{self.org_name}-README.md"
 
-        try:
-            output_path.write_text(self._readme_content, encoding="utf-8")
-            self.app.notify(
-                f"Saved to {output_path.name}",
-                title="README Saved",
-                timeout=3,
-            )
-        except Exception as e:
-            self.app.notify(
-                f"Failed to save: {e}",
-                severity="error",
-                timeout=3,
-            )
+        # Large READMEs on slow disks would stall the UI, so write in a thread.
+        # A failed write is reported in on_worker_state_changed, not fatal.
+        self.run_worker(
+            partial(_write_readme, output_path, self._readme_content),
+            name="save_readme",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
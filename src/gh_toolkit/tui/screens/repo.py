@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 import webbrowser
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
+from rich.console import Group
+from rich.rule import Rule
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -18,6 +23,10 @@ from gh_toolkit.core.repo_cloner import CloneResult, RepoCloner
 if TYPE_CHECKING:
     from gh_toolkit.tui.app import GhToolkitApp
 
+# Health check result icons
+_ICON_PASS = "\u2705"
+_ICON_FAIL = "\u274c"
+
 
 class RepoScreen(Screen[None]):
     """Screen displaying repository details."""
@@ -48,8 +57,8 @@ class RepoScreen(Screen[None]):
         """Get full repository name."""
         return f"{self.org_name}/{self.repo_name}"
 
-    def compose(self) -> ComposeResult:
-        """Compose the repository details screen."""
+    def _build_info_block(self) -> Group:
+        """Render the static repository details as one Rich renderable."""
         # Extract repo info
         description = self.repo_data.get("description") or "No description"
         stars = self.repo_data.get("stargazers_count", 0)
@@ -64,36 +73,45 @@ class RepoScreen(Screen[None]):
         # Format topics
         topics_str = ", ".join(topics) if topics else "None"
 
+        meta = Text(
+            f"Language:  {language}\n"
+            f"License:   {license_name}\n"
+            f"Topics:    {topics_str}\n"
+            f"Updated:   {updated_at}",
+            style="dim",
+        )
+
+        return Group(
+            Text(self.full_name, style="bold"),
+            Text(""),
+            Rule(style="none"),
+            Text(""),
+            Text(description),
+            Text(""),
+            Text(f"\u2b50 {stars} stars   \U0001f374 {forks} forks   \U0001f441 {watchers} watchers"),
+            Text(""),
+            meta,
+            Text(""),
+            Rule(style="none"),
+            Text("Actions", style="bold"),
+            Text(""),
+        )
+
+    def compose(self) -> ComposeResult:
+        """Compose the repository details screen."""
         yield Vertical(
             Static(f"\u2190 {self.repo_name}", classes="screen-title"),
             VerticalScroll(
                 Vertical(
-                    Static(self.full_name, classes="repo-header"),
-                    Static("\u2500" * 60),
-                    Static(""),
-                    Static(description, classes="repo-description"),
-                    Static(""),
-                    Static(
-                        f"\u2b50 {stars} stars   \U0001f374 {forks} forks   \U0001f441 {watchers} watchers",
-                        classes="repo-stats",
-                    ),
-                    Static(""),
-                    Static(f"Language:  {language}", classes="repo-meta"),
-                    Static(f"License:   {license_name}", classes="repo-meta"),
-                    Static(f"Topics:    {topics_str}", classes="repo-meta"),
-                    Static(f"Updated:   {updated_at}", classes="repo-meta"),
-                    Static(""),
-                    Static("\u2500" * 60),
-                    Static("Actions", classes="repo-header"),
-                    Static(""),
+                    # One widget for the read-only details instead of one per line
+                    Static(self._build_info_block()),
                     Horizontal(
                         Button("[h] Health Check", id="btn-health", variant="default"),
                         Button("[c] Clone", id="btn-clone", variant="default"),
                         Button("[o] Open in Browser", id="btn-open", variant="default"),
                         classes="actions",
                     ),
-                    Static(""),
-                    Static("\u2500" * 60),
+                    Static(Group(Text(""), Rule(style="none"))),
                     Static("", id="health-header", classes="repo-header"),
                     Static("", id="health-results", classes="health-results"),
                     classes="repo-details",
@@ -120,8 +138,9 @@ class RepoScreen(Screen[None]):
         """Open repository in web browser."""
         url = self.repo_data.get("html_url", "")
         if url:
-            webbrowser.open(url)
             self.app.notify(f"Opened {self.repo_name} in browser", timeout=2)
+            # Launching a browser can block, so keep it off the UI thread
+            threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
         else:
             self.app.notify("No URL available", severity="error", timeout=2)
 
@@ -200,11 +219,9 @@ class RepoScreen(Screen[None]):
         lines.append("")
 
         # Group checks by category
-        by_category: dict[str, list[str]] = {}
+        by_category: defaultdict[str, list[str]] = defaultdict(list)
         for check in report.checks:
-            if check.category not in by_category:
-                by_category[check.category] = []
-            icon = "\u2705" if check.passed else "\u274c"
+            icon = _ICON_PASS if check.passed else _ICON_FAIL
             by_category[check.category].append(f"  {icon} {check.name}: {check.message}")
 
         for category, check_lines in by_category.items():
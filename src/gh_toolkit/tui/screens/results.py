@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from itertools import islice
 from typing import TYPE_CHECKING
 
+from rich.console import Group, RenderableType
+from rich.padding import Padding
+from rich.table import Table
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
@@ -13,6 +19,27 @@ from textual.widgets import Button, Static
 if TYPE_CHECKING:
     from gh_toolkit.tui.widgets.action_executor import ExecutionResult
 
+# (icon, style) shown next to each repo, by result status
+_STATUS_ICONS = {
+    "success": ("\u2713", "green"),
+    "dry_run": ("\u2713", "cyan"),
+    "error": ("\u2717", "red"),
+    "skipped": ("\u2192", "yellow"),
+    "issues_found": ("!", "yellow"),
+}
+_UNKNOWN_ICON = ("?", "dim")
+
+# Display title for each action name
+_ACTION_TITLES = {
+    "describe": "Describe",
+    "readme": "Readme",
+    "license": "License",
+    "tag": "Tag",
+    "badges": "Badges",
+    "health": "Health",
+    "audit": "Audit",
+}
+
 
 class ResultsScreen(ModalScreen[None]):
     """Modal screen showing action execution results."""
@@ -36,67 +63,63 @@ class ResultsScreen(ModalScreen[None]):
         yield Vertical(
             Static("Action Results", classes="modal-title"),
             VerticalScroll(
-                Static(self._format_results(), classes="results-content", markup=True),
+                # Pre-styled Text, so no markup parsing (and repo messages
+                # containing brackets are shown as-is)
+                Static(Group(*self._iter_rows()), classes="results-content"),
                 id="results-scroll",
             ),
             Button("Close", variant="primary", id="btn-close"),
             classes="results-modal",
         )
 
-    def _format_results(self) -> str:
-        """Format results for display."""
-        lines = []
-
+    def _iter_rows(self) -> Iterator[RenderableType]:
+        """Yield each action's header, summary and a table of repo results."""
         for result in self.results:
             # Action header
-            action_name = result.action.replace("_", " ").title()
+            action_name = _ACTION_TITLES.get(result.action)
+            if action_name is None:
+                action_name = result.action.replace("_", " ").title()
             if result.dry_run:
-                lines.append(f"[bold cyan]{action_name}[/bold cyan] [dim](dry run)[/dim]")
+                yield Text.assemble((action_name, "bold cyan"), " ", ("(dry run)", "dim"))
             else:
-                lines.append(f"[bold cyan]{action_name}[/bold cyan]")
+                yield Text(action_name, style="bold cyan")
 
             # Summary
-            lines.append(
-                f"  [green]{result.success_count}[/green] success, "
-                f"[red]{result.error_count}[/red] errors, "
-                f"[yellow]{result.skipped_count}[/yellow] skipped"
+            yield Text.assemble(
+                "  ",
+                (str(result.success_count), "green"),
+                " success, ",
+                (str(result.error_count), "red"),
+                " errors, ",
+                (str(result.skipped_count), "yellow"),
+                " skipped",
             )
-            lines.append("")
+            yield Text()
 
-            # Details for each repo
-            for item in result.results[:20]:  # Limit to 20 items
+            # Details for each repo, as aligned icon | repo | detail columns
+            table = Table.grid(padding=(0, 1))
+            for item in islice(result.results, 20):  # Limit to 20 items
                 repo = item.get("repo", "unknown")
-                status = item.get("status", "unknown")
-
-                if status == "success":
-                    icon = "[green]\u2713[/green]"
-                elif status == "dry_run":
-                    icon = "[cyan]\u2713[/cyan]"
-                elif status == "error":
-                    icon = "[red]\u2717[/red]"
-                elif status == "skipped":
-                    icon = "[yellow]\u2192[/yellow]"
-                elif status == "issues_found":
-                    icon = "[yellow]![/yellow]"
-                else:
-                    icon = "[dim]?[/dim]"
+                icon, icon_style = _STATUS_ICONS.get(item.get("status", "unknown"), _UNKNOWN_ICON)
 
                 detail = ""
-                if "message" in item:
-                    detail = f" - {item['message']}"
-                elif "issues" in item and item["issues"]:
-                    detail = f" - {', '.join(item['issues'])}"
-                elif "grade" in item:
-                    detail = f" - Grade: {item['grade']} ({item['score']}%)"
-
-                lines.append(f"  {icon} {repo}{detail}")
+                if (message := item.get("message")) is not None:
+                    detail = str(message)
+                elif (exception := item.get("exception")) is not None:
+                    detail = str(exception)
+                elif issues := item.get("issues"):
+                    detail = ", ".join(issues)
+                elif (grade := item.get("grade")) is not None:
+                    detail = f"Grade: {grade} ({item['score']}%)"
+
+                table.add_row(Text(icon, style=icon_style), Text(repo), Text(detail))
+            if table.row_count:
+                yield Padding(table, (0, 0, 0, 2))
 
             if len(result.results) > 20:
-                lines.append(f"  [dim]... and {len(result.results) - 20} more[/dim]")
-
-            lines.append("")
+                yield Text.assemble("  ", (f"... and {len(result.results) - 20} more", "dim"))
 
-        return "\n".join(lines)
+            yield Text()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
@@ -2,5 +2,12 @@
 
 from gh_toolkit.tui.widgets.action_executor import ActionExecutor, ExecutionResult
 from gh_toolkit.tui.widgets.action_modal import ActionModal, ActionResult
+from gh_toolkit.tui.widgets.virtual_list import VirtualList
 
-__all__ = ["ActionModal", "ActionResult", "ActionExecutor", "ExecutionResult"]
+__all__ = [
+    "ActionModal",
+    "ActionResult",
+    "ActionExecutor",
+    "ExecutionResult",
+    "VirtualList",
+]
@@ -3,14 +3,148 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from gh_toolkit.core.github_client import GitHubAPIError, GitHubClient
+from gh_toolkit.core.health_checker import RepositoryHealthChecker
+from gh_toolkit.core.topic_tagger import TopicTagger
+
+# Optional action backends; each action reports itself unavailable if its import failed
+try:
+    from gh_toolkit.core.description_generator import DescriptionGenerator
+except ImportError:
+    DescriptionGenerator = None  # type: ignore[assignment,misc]
+
+try:
+    from gh_toolkit.core.repo_readme_generator import RepoReadmeGenerator
+except ImportError:
+    RepoReadmeGenerator = None  # type: ignore[assignment,misc]
+
+try:
+    from gh_toolkit.core.license_manager import LicenseManager
+except ImportError:
+    LicenseManager = None  # type: ignore[assignment,misc]
+
+try:
+    from gh_toolkit.commands.repo import _apply_badges_to_readme, generate_badge_markdown
+except ImportError:
+    _apply_badges_to_readme = generate_badge_markdown = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from gh_toolkit.tui.widgets.action_modal import ActionResult
 
+# Model used by AI actions when none is chosen
+DEFAULT_MODEL = "claude-3-haiku-20240307"
 
-@dataclass
+# Actions that don't modify repos, so API data fetched by one stays valid for the next
+_READ_ONLY_ACTIONS = frozenset({"badges", "health", "audit"})
+
+# How long fetched repo topics and metadata are reused, including by later runs
+REPO_DATA_TTL_SECONDS = 60.0
+
+# Most entries kept in _repo_data_cache; the oldest are evicted first
+REPO_DATA_CACHE_MAX_ENTRIES = 4096
+
+# (kind, owner, repo) -> (fetch time from time.monotonic(), API data), oldest first
+_repo_data_cache: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+_repo_data_lock = threading.Lock()
+
+# Default for MAX_WORKERS when GH_TOOLKIT_WORKERS is unset or not a number
+DEFAULT_MAX_WORKERS = 16
+
+
+def _max_workers_from_env() -> int:
+    """Read GH_TOOLKIT_WORKERS, falling back to the default for bad values."""
+    try:
+        workers = int(os.environ.get("GH_TOOLKIT_WORKERS", DEFAULT_MAX_WORKERS))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+    return max(1, workers)
+
+
+# Repos processed concurrently by the per-repo actions (badges, health, audit)
+MAX_WORKERS = _max_workers_from_env()
+
+
+def _pool_size(repos: Sequence[tuple[str, str]]) -> int:
+    """Get the worker count for a per-repo pool (no idle threads for small runs)."""
+    return max(1, min(MAX_WORKERS, len(repos)))
+
+
+def _store_repo_data(key: tuple[str, str, str], fetched_at: float, value: Any) -> None:
+    """Cache repo data, evicting the oldest entries beyond the size limit."""
+    with _repo_data_lock:
+        _repo_data_cache[key] = (fetched_at, value)
+        _repo_data_cache.move_to_end(key)
+        while len(_repo_data_cache) > REPO_DATA_CACHE_MAX_ENTRIES:
+            _repo_data_cache.popitem(last=False)
+
+
+def _clear_repo_data() -> None:
+    """Drop all cached repo data."""
+    with _repo_data_lock:
+        _repo_data_cache.clear()
+
+
+def _tally(
+    results: list[dict[str, Any]],
+    success_statuses: tuple[str, ...] = ("success", "dry_run"),
+    error_statuses: tuple[str, ...] = ("error",),
+) -> tuple[int, int, int]:
+    """Count (success, error, skipped) results in a single pass over them."""
+    counts = Counter(r.get("status") for r in results)
+    return (
+        sum(counts[status] for status in success_statuses),
+        sum(counts[status] for status in error_statuses),
+        counts["skipped"],
+    )
+
+
+@lru_cache(maxsize=2048)
+def _badge(topic: str, style: str) -> str:
+    """Get linked badge markdown for a topic (repos share many topics)."""
+    return generate_badge_markdown(topic, style, True)
+
+
+def _audit_result(
+    owner: str, repo: str, repo_data: dict[str, Any], topics: list[str]
+) -> dict[str, Any]:
+    """Build the audit result for a repo from its metadata and topics."""
+    repo_issues = []
+
+    # Check for missing description
+    if not repo_data.get("description"):
+        repo_issues.append("missing_description")
+
+    # Check for missing topics
+    if not topics:
+        repo_issues.append("missing_topics")
+
+    # Check for missing license
+    if not repo_data.get("license"):
+        repo_issues.append("missing_license")
+
+    if repo_issues:
+        return {
+            "repo": f"{owner}/{repo}",
+            "status": "issues_found",
+            "issues": repo_issues,
+        }
+    return {
+        "repo": f"{owner}/{repo}",
+        "status": "success",
+        "issues": [],
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
     """Result of executing an action."""
 
@@ -18,7 +152,7 @@ class ExecutionResult:
     success_count: int
     error_count: int
     skipped_count: int
-    results: list[dict[str, Any]]
+    results: tuple[dict[str, Any], ...]
     dry_run: bool
 
 
@@ -40,44 +174,41 @@ class ActionExecutor:
             List of execution results for each action
         """
         results = []
-        actions = action_result.action.split(",")
-
-        for action in actions:
-            if action == "describe":
-                results.append(self._execute_describe(action_result))
-            elif action == "readme":
-                results.append(self._execute_readme(action_result))
-            elif action == "license":
-                results.append(self._execute_license(action_result))
-            elif action == "tag":
-                results.append(self._execute_tag(action_result))
-            elif action == "badges":
-                results.append(self._execute_badges(action_result))
-            elif action == "health":
-                results.append(self._execute_health(action_result))
-            elif action == "audit":
-                results.append(self._execute_audit(action_result))
+        for action in action_result.actions:
+            handler = self._DISPATCH.get(action)
+            if handler is not None:
+                results.append(handler(self, action_result))
+            if action not in _READ_ONLY_ACTIONS:
+                # The action may have changed topics or descriptions
+                _clear_repo_data()
 
         return results
 
+    def _cached(self, kind: str, owner: str, repo: str, fetch: Callable[[], Any]) -> Any:
+        """Get repo data fetched in the last REPO_DATA_TTL_SECONDS, or fetch it."""
+        key = (kind, owner, repo)
+        now = time.monotonic()
+        cached = _repo_data_cache.get(key)
+        if cached is not None and now - cached[0] < REPO_DATA_TTL_SECONDS:
+            return cached[1]
+        value = fetch()
+        _store_repo_data(key, now, value)
+        return value
+
     def _execute_describe(self, action_result: ActionResult) -> ExecutionResult:
         """Execute description generation."""
-        from gh_toolkit.core.github_client import GitHubClient
-
-        try:
-            from gh_toolkit.core.description_generator import DescriptionGenerator
-        except ImportError:
+        if DescriptionGenerator is None:
             return ExecutionResult(
                 action="describe",
                 success_count=0,
                 error_count=1,
                 skipped_count=0,
-                results=[{"error": "DescriptionGenerator not available"}],
+                results=({"error": "DescriptionGenerator not available"},),
                 dry_run=action_result.dry_run,
             )
 
         client = GitHubClient(self.github_token)
-        model = action_result.options.get("describe_model", "claude-3-haiku-20240307")
+        model = action_result.options.get("describe_model", DEFAULT_MODEL)
         generator = DescriptionGenerator(client, self.anthropic_key, 0.5, model)
 
         results = generator.process_multiple_repositories(
@@ -86,26 +217,21 @@ class ActionExecutor:
             action_result.options.get("describe_force", False),
         )
 
-        success = len([r for r in results if r.get("status") == "success"])
-        errors = len([r for r in results if r.get("status") == "error"])
-        skipped = len([r for r in results if r.get("status") == "skipped"])
+        success, errors, skipped = _tally(results)
 
         return ExecutionResult(
             action="describe",
             success_count=success,
             error_count=errors,
             skipped_count=skipped,
-            results=results,
+            results=tuple(results),
             dry_run=action_result.dry_run,
         )
 
     def _execute_tag(self, action_result: ActionResult) -> ExecutionResult:
         """Execute topic tagging."""
-        from gh_toolkit.core.github_client import GitHubClient
-        from gh_toolkit.core.topic_tagger import TopicTagger
-
         client = GitHubClient(self.github_token)
-        model = action_result.options.get("tag_model", "claude-3-haiku-20240307")
+        model = action_result.options.get("tag_model", DEFAULT_MODEL)
         preferred = action_result.options.get("tag_preferred", "")
 
         tagger = TopicTagger(client, self.anthropic_key, 0.5, model, preferred or None)
@@ -117,213 +243,218 @@ class ActionExecutor:
             False,  # add_description
         )
 
-        success = len([r for r in results if r.get("status") == "success"])
-        errors = len([r for r in results if r.get("status") == "error"])
-        skipped = len([r for r in results if r.get("status") == "skipped"])
+        success, errors, skipped = _tally(results)
 
         return ExecutionResult(
             action="tag",
             success_count=success,
             error_count=errors,
             skipped_count=skipped,
-            results=results,
+            results=tuple(results),
             dry_run=action_result.dry_run,
         )
 
     def _execute_badges(self, action_result: ActionResult) -> ExecutionResult:
         """Execute badge generation."""
-        from gh_toolkit.core.github_client import GitHubClient
-
-        # Import badge functions from repo commands
-        try:
-            from gh_toolkit.commands.repo import (
-                _apply_badges_to_readme,
-                generate_badge_markdown,
-            )
-        except ImportError:
+        if generate_badge_markdown is None:
             return ExecutionResult(
                 action="badges",
                 success_count=0,
                 error_count=1,
                 skipped_count=0,
-                results=[{"error": "Badge functions not available"}],
+                results=({"error": "Badge functions not available"},),
                 dry_run=action_result.dry_run,
             )
 
-        client = GitHubClient(self.github_token)
+        client = GitHubClient(self.github_token, pool_maxsize=MAX_WORKERS)
         style = action_result.options.get("badges_style", "flat-square")
         apply = action_result.options.get("badges_apply", False) and not action_result.dry_run
 
-        results = []
-        success_count = 0
-        error_count = 0
-
-        for owner, repo in action_result.repos:
-            try:
-                topics = client.get_repo_topics(owner, repo)
-                if not topics:
-                    results.append({
-                        "repo": f"{owner}/{repo}",
-                        "status": "skipped",
-                        "message": "No topics found",
-                    })
-                    continue
-
-                # Limit to 10 topics
-                topics = topics[:10]
-
-                # Generate badges
-                badges = [generate_badge_markdown(topic, style, True) for topic in topics]
-                badge_line = " ".join(badges)
-
-                if apply:
-                    _apply_badges_to_readme(client, owner, repo, badge_line)
-                    results.append({
-                        "repo": f"{owner}/{repo}",
-                        "status": "success",
-                        "message": f"Applied {len(badges)} badges",
-                        "badges": badge_line,
-                    })
-                else:
-                    results.append({
-                        "repo": f"{owner}/{repo}",
-                        "status": "dry_run" if action_result.dry_run else "success",
-                        "message": f"Generated {len(badges)} badges",
-                        "badges": badge_line,
-                    })
-                success_count += 1
-
-            except Exception as e:
-                results.append({
-                    "repo": f"{owner}/{repo}",
-                    "status": "error",
-                    "message": str(e),
-                })
-                error_count += 1
+        # Each repo is one or more blocking API calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=_pool_size(action_result.repos)) as pool:
+            results = list(
+                pool.map(
+                    lambda pair: self._badges_one(
+                        client, *pair, style, apply, action_result.dry_run
+                    ),
+                    action_result.repos,
+                )
+            )
+        success, errors, skipped = _tally(results)
 
         return ExecutionResult(
             action="badges",
-            success_count=success_count,
-            error_count=error_count,
-            skipped_count=len([r for r in results if r.get("status") == "skipped"]),
-            results=results,
+            success_count=success,
+            error_count=errors,
+            skipped_count=skipped,
+            results=tuple(results),
             dry_run=action_result.dry_run,
         )
 
-    def _execute_health(self, action_result: ActionResult) -> ExecutionResult:
-        """Execute health checks."""
-        from gh_toolkit.core.github_client import GitHubClient
-        from gh_toolkit.core.health_checker import RepositoryHealthChecker
+    def _badges_one(
+        self,
+        client: GitHubClient,
+        owner: str,
+        repo: str,
+        style: str,
+        apply: bool,
+        dry_run: bool,
+    ) -> dict[str, Any]:
+        """Generate (and optionally apply) topic badges for one repository."""
+        try:
+            topics = self._cached(
+                "topics", owner, repo, lambda: client.get_repo_topics(owner, repo)
+            )
+            if not topics:
+                return {
+                    "repo": f"{owner}/{repo}",
+                    "status": "skipped",
+                    "message": "No topics found",
+                }
 
-        client = GitHubClient(self.github_token)
-        checker = RepositoryHealthChecker(client)
+            # Limit to 10 topics
+            topics = topics[:10]
 
-        results = []
-        for owner, repo in action_result.repos:
-            try:
-                report = checker.check_repository(owner, repo)
-                results.append({
+            # Generate badges
+            badge_line = " ".join(_badge(topic, style) for topic in topics)
+
+            if apply:
+                _apply_badges_to_readme(client, owner, repo, badge_line)
+                return {
                     "repo": f"{owner}/{repo}",
                     "status": "success",
-                    "score": report.overall_score,
-                    "grade": report.grade,
-                    "passed": report.passed_checks,
-                    "failed": report.failed_checks,
-                })
-            except Exception as e:
-                results.append({
-                    "repo": f"{owner}/{repo}",
-                    "status": "error",
-                    "message": str(e),
-                })
+                    "message": f"Applied {len(topics)} badges",
+                    "badges": badge_line,
+                }
+            return {
+                "repo": f"{owner}/{repo}",
+                "status": "dry_run" if dry_run else "success",
+                "message": f"Generated {len(topics)} badges",
+                "badges": badge_line,
+            }
+
+        except Exception as e:
+            return {
+                "repo": f"{owner}/{repo}",
+                "status": "error",
+                # Formatted only if the results screen shows this row
+                "exception": e.with_traceback(None),
+            }
 
-        success = len([r for r in results if r.get("status") == "success"])
-        errors = len([r for r in results if r.get("status") == "error"])
+    def _execute_health(self, action_result: ActionResult) -> ExecutionResult:
+        """Execute health checks."""
+        client = GitHubClient(self.github_token, pool_maxsize=MAX_WORKERS)
+        checker = RepositoryHealthChecker(client)
+
+        with ThreadPoolExecutor(max_workers=_pool_size(action_result.repos)) as pool:
+            results = list(
+                pool.map(lambda pair: self._health_one(checker, *pair), action_result.repos)
+            )
+
+        success, errors, _ = _tally(results)
 
         return ExecutionResult(
             action="health",
             success_count=success,
             error_count=errors,
             skipped_count=0,
-            results=results,
+            results=tuple(results),
             dry_run=False,  # Health checks are always "real"
         )
 
+    def _health_one(
+        self, checker: RepositoryHealthChecker, owner: str, repo: str
+    ) -> dict[str, Any]:
+        """Run the health check for one repository."""
+        try:
+            report = checker.check_repository_health(f"{owner}/{repo}")
+            passed = sum(check.passed for check in report.checks)
+            return {
+                "repo": f"{owner}/{repo}",
+                "status": "success",
+                "score": round(report.percentage),
+                "grade": report.grade,
+                "passed": passed,
+                "failed": len(report.checks) - passed,
+            }
+        except Exception as e:
+            return {
+                "repo": f"{owner}/{repo}",
+                "status": "error",
+                # Formatted only if the results screen shows this row
+                "exception": e.with_traceback(None),
+            }
+
     def _execute_audit(self, action_result: ActionResult) -> ExecutionResult:
         """Execute repository audit."""
-        from gh_toolkit.core.github_client import GitHubClient
-
-        client = GitHubClient(self.github_token)
+        client = GitHubClient(self.github_token, pool_maxsize=MAX_WORKERS)
 
-        results = []
-        issues_found = 0
-
-        for owner, repo in action_result.repos:
+        # One GraphQL request per 100 repos (it needs a token); anything it
+        # couldn't fetch falls back to the per-repo REST calls
+        bulk: dict[tuple[str, str], dict[str, Any]] = {}
+        if client.token:
             try:
-                repo_data = client.get_repo(owner, repo)
-                repo_issues = []
-
-                # Check for missing description
-                if not repo_data.get("description"):
-                    repo_issues.append("missing_description")
-
-                # Check for missing topics
-                topics = client.get_repo_topics(owner, repo)
-                if not topics:
-                    repo_issues.append("missing_topics")
-
-                # Check for missing license
-                if not repo_data.get("license"):
-                    repo_issues.append("missing_license")
-
-                if repo_issues:
-                    issues_found += 1
-                    results.append({
-                        "repo": f"{owner}/{repo}",
-                        "status": "issues_found",
-                        "issues": repo_issues,
-                    })
-                else:
-                    results.append({
-                        "repo": f"{owner}/{repo}",
-                        "status": "success",
-                        "issues": [],
-                    })
-
-            except Exception as e:
-                results.append({
-                    "repo": f"{owner}/{repo}",
-                    "status": "error",
-                    "message": str(e),
-                })
+                bulk = client.get_repos_bulk(action_result.repos)
+            except GitHubAPIError:
+                pass
+        now = time.monotonic()
+        for (owner, repo), repo_data in bulk.items():
+            _store_repo_data(("topics", owner, repo), now, repo_data["topics"])
+
+        with ThreadPoolExecutor(max_workers=_pool_size(action_result.repos)) as pool:
+            results = list(
+                pool.map(
+                    lambda pair: (
+                        _audit_result(*pair, bulk[pair], bulk[pair]["topics"])
+                        if pair in bulk
+                        else self._audit_one(client, *pair)
+                    ),
+                    action_result.repos,
+                )
+            )
+
+        success, errors, _ = _tally(results, success_statuses=("success",))
 
         return ExecutionResult(
             action="audit",
-            success_count=len([r for r in results if r.get("status") == "success"]),
-            error_count=len([r for r in results if r.get("status") == "error"]),
+            success_count=success,
+            error_count=errors,
             skipped_count=0,
-            results=results,
+            results=tuple(results),
             dry_run=False,
         )
 
+    def _audit_one(self, client: GitHubClient, owner: str, repo: str) -> dict[str, Any]:
+        """Audit one repository for missing description, topics and license."""
+        try:
+            repo_data = self._cached("repo", owner, repo, lambda: client.get_repo(owner, repo))
+            topics = self._cached(
+                "topics", owner, repo, lambda: client.get_repo_topics(owner, repo)
+            )
+            return _audit_result(owner, repo, repo_data, topics)
+
+        except Exception as e:
+            return {
+                "repo": f"{owner}/{repo}",
+                "status": "error",
+                # Formatted only if the results screen shows this row
+                "exception": e.with_traceback(None),
+            }
+
     def _execute_readme(self, action_result: ActionResult) -> ExecutionResult:
         """Execute README generation."""
-        from gh_toolkit.core.github_client import GitHubClient
-
-        try:
-            from gh_toolkit.core.repo_readme_generator import RepoReadmeGenerator
-        except ImportError:
+        if RepoReadmeGenerator is None:
             return ExecutionResult(
                 action="readme",
                 success_count=0,
                 error_count=1,
                 skipped_count=0,
-                results=[{"error": "RepoReadmeGenerator not available"}],
+                results=({"error": "RepoReadmeGenerator not available"},),
                 dry_run=action_result.dry_run,
             )
 
         client = GitHubClient(self.github_token)
-        model = action_result.options.get("readme_model", "claude-3-haiku-20240307")
+        model = action_result.options.get("readme_model", DEFAULT_MODEL)
         generator = RepoReadmeGenerator(client, self.anthropic_key, 0.5, model)
 
         results = generator.process_multiple_repositories(
@@ -333,33 +464,30 @@ class ActionExecutor:
             0.5,  # min_quality threshold
         )
 
-        success = len([r for r in results if r.get("status") == "updated"])
-        errors = len([r for r in results if r.get("status") in ("failed", "error")])
-        skipped = len([r for r in results if r.get("status") == "skipped"])
-        dry_run_count = len([r for r in results if r.get("status") == "dry_run"])
+        success, errors, skipped = _tally(
+            results,
+            success_statuses=("updated", "dry_run"),
+            error_statuses=("failed", "error"),
+        )
 
         return ExecutionResult(
             action="readme",
-            success_count=success + dry_run_count,
+            success_count=success,
             error_count=errors,
             skipped_count=skipped,
-            results=results,
+            results=tuple(results),
             dry_run=action_result.dry_run,
         )
 
     def _execute_license(self, action_result: ActionResult) -> ExecutionResult:
         """Execute license addition."""
-        from gh_toolkit.core.github_client import GitHubClient
-
-        try:
-            from gh_toolkit.core.license_manager import LicenseManager
-        except ImportError:
+        if LicenseManager is None:
             return ExecutionResult(
                 action="license",
                 success_count=0,
                 error_count=1,
                 skipped_count=0,
-                results=[{"error": "LicenseManager not available"}],
+                results=({"error": "LicenseManager not available"},),
                 dry_run=action_result.dry_run,
             )
 
@@ -375,17 +503,26 @@ class ActionExecutor:
             action_result.options.get("license_force", False),
         )
 
-        created = len([r for r in results if r.get("status") == "created"])
-        updated = len([r for r in results if r.get("status") == "updated"])
-        errors = len([r for r in results if r.get("status") == "error"])
-        skipped = len([r for r in results if r.get("status") == "skipped"])
-        dry_run_count = len([r for r in results if r.get("status") == "dry_run"])
+        success, errors, skipped = _tally(
+            results, success_statuses=("created", "updated", "dry_run")
+        )
 
         return ExecutionResult(
             action="license",
-            success_count=created + updated + dry_run_count,
+            success_count=success,
             error_count=errors,
             skipped_count=skipped,
-            results=results,
+            results=tuple(results),
             dry_run=action_result.dry_run,
         )
+
+    # Action name -> handler, built once with the class
+    _DISPATCH: ClassVar[dict[str, Callable[[ActionExecutor, ActionResult], ExecutionResult]]] = {
+        "describe": _execute_describe,
+        "readme": _execute_readme,
+        "license": _execute_license,
+        "tag": _execute_tag,
+        "badges": _execute_badges,
+        "health": _execute_health,
+        "audit": _execute_audit,
+    }
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
+from weakref import WeakValueDictionary
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     Checkbox,
@@ -19,18 +22,137 @@ from textual.widgets import (
     Static,
 )
 
+from gh_toolkit.tui.widgets.action_executor import DEFAULT_MODEL
+
+# (checkbox id, action name) for each action, in execution order
+_ACTION_IDS = (
+    ("action-describe", "describe"),
+    ("action-readme", "readme"),
+    ("action-license", "license"),
+    ("action-tag", "tag"),
+    ("action-badges", "badges"),
+    ("action-health", "health"),
+    ("action-audit", "audit"),
+)
+
+# Actions with an options section, in the order the sections are shown
+_SECTION_ORDER = ("describe", "tag", "badges", "health", "readme", "license")
+
+# (label, button id, initially pressed) for the buttons of each radio set
+_MODEL_BUTTONS = (
+    ("Haiku (fast)", "model-haiku", True),
+    ("Sonnet (balanced)", "model-sonnet", False),
+    ("Opus (best)", "model-opus", False),
+)
+_TAG_MODEL_BUTTONS = (
+    ("Haiku (fast)", "tag-model-haiku", True),
+    ("Sonnet (balanced)", "tag-model-sonnet", False),
+)
+_README_MODEL_BUTTONS = (
+    ("Haiku (fast)", "readme-model-haiku", True),
+    ("Sonnet (balanced)", "readme-model-sonnet", False),
+    ("Opus (best)", "readme-model-opus", False),
+)
+_STYLE_BUTTONS = (
+    ("flat-square", "style-flat-square", True),
+    ("flat", "style-flat", False),
+    ("for-the-badge", "style-badge", False),
+)
+_RULES_BUTTONS = (
+    ("Default", "rules-default", True),
+    ("Academic", "rules-academic", False),
+    ("Professional", "rules-professional", False),
+)
+_LICENSE_BUTTONS = (
+    ("MIT", "license-mit", True),
+    ("Apache 2.0", "license-apache", False),
+    ("GPL 3.0", "license-gpl", False),
+    ("BSD 3-Clause", "license-bsd", False),
+)
 
-@dataclass
+type _Buttons = tuple[tuple[str, str, bool], ...]
+type _RadioRow = tuple[str, str, _Buttons, str]
+
+# Action checkbox id -> (section title, (row label, radio set id, buttons,
+# classes), (checkbox label, checkbox id) or None)
+_SECTION_SPECS: dict[str, tuple[str, _RadioRow, tuple[str, str] | None]] = {
+    "action-describe": (
+        "Description Options",
+        ("Model:", "describe-model", _MODEL_BUTTONS, "model-select"),
+        ("Force update existing", "describe-force"),
+    ),
+    "action-tag": (
+        "Topic Options",
+        ("Model:", "tag-model", _TAG_MODEL_BUTTONS, "model-select"),
+        ("Force update existing", "tag-force"),
+    ),
+    "action-badges": (
+        "Badge Options",
+        ("Style:", "badges-style", _STYLE_BUTTONS, "style-select"),
+        ("Apply to README files", "badges-apply"),
+    ),
+    "action-health": (
+        "Health Check Options",
+        ("Rule set:", "health-rules", _RULES_BUTTONS, "rules-select"),
+        None,
+    ),
+    "action-readme": (
+        "README Options",
+        ("Model:", "readme-model", _README_MODEL_BUTTONS, "model-select"),
+        ("Force update all READMEs", "readme-force"),
+    ),
+    "action-license": (
+        "License Options",
+        ("License:", "license-type", _LICENSE_BUTTONS, "style-select"),
+        ("Replace existing licenses", "license-force"),
+    ),
+}
+
+# Class strings shared by many widgets (Textual only accepts classes as a str)
+_FIELD_ROW = "field-row"
+_FIELD_LABEL = "field-label"
+_SECTION_HEADER = "section-header"
+
+# Radio button id -> option value, per radio set
+_MODEL_NAMES = {
+    "model-haiku": DEFAULT_MODEL,
+    "tag-model-haiku": DEFAULT_MODEL,
+    "readme-model-haiku": DEFAULT_MODEL,
+    "model-sonnet": "claude-sonnet-4-20250514",
+    "tag-model-sonnet": "claude-sonnet-4-20250514",
+    "readme-model-sonnet": "claude-sonnet-4-20250514",
+    "model-opus": "claude-opus-4-20250514",
+    "readme-model-opus": "claude-opus-4-20250514",
+}
+_BADGE_STYLES = {
+    "style-flat-square": "flat-square",
+    "style-flat": "flat",
+    "style-badge": "for-the-badge",
+}
+_HEALTH_RULES = {
+    "rules-default": "default",
+    "rules-academic": "academic",
+    "rules-professional": "professional",
+}
+_LICENSE_TYPES = {
+    "license-mit": "mit",
+    "license-apache": "apache-2.0",
+    "license-gpl": "gpl-3.0",
+    "license-bsd": "bsd-3-clause",
+}
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class ActionResult:
     """Result of action execution."""
 
-    action: str
-    repos: list[tuple[str, str]]  # (owner, repo) tuples
+    actions: tuple[str, ...]
+    repos: tuple[tuple[str, str], ...]  # (owner, repo) tuples
     options: dict[str, Any]
     dry_run: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, frozen=True)
 class ActionOptions:
     """Options for a specific action."""
 
@@ -38,11 +160,11 @@ class ActionOptions:
     dry_run: bool = False
 
     # Describe options
-    describe_model: str = "claude-3-haiku-20240307"
+    describe_model: str = DEFAULT_MODEL
     describe_force: bool = False
 
     # Tag options
-    tag_model: str = "claude-3-haiku-20240307"
+    tag_model: str = DEFAULT_MODEL
     tag_force: bool = False
     tag_preferred: str = ""
 
@@ -55,7 +177,7 @@ class ActionOptions:
     health_rules: str = "default"
 
     # README options
-    readme_model: str = "claude-3-haiku-20240307"
+    readme_model: str = DEFAULT_MODEL
     readme_force: bool = False
     readme_min_quality: float = 0.5
 
@@ -64,7 +186,11 @@ class ActionOptions:
     license_force: bool = False
 
     # Selected actions
-    actions: list[str] = field(default_factory=list)
+    actions: tuple[str, ...] = ()
+
+
+# Shared defaults; derive changed options with dataclasses.replace
+DEFAULT_OPTIONS = ActionOptions()
 
 
 class ActionModal(ModalScreen[ActionResult | None]):
@@ -77,7 +203,7 @@ class ActionModal(ModalScreen[ActionResult | None]):
 
     def __init__(
         self,
-        repos: list[tuple[str, str]],
+        repos: Sequence[tuple[str, str]],
         scope_description: str = "selected repositories",
     ) -> None:
         """Initialize action modal.
@@ -87,9 +213,18 @@ class ActionModal(ModalScreen[ActionResult | None]):
             scope_description: Human-readable description of scope
         """
         super().__init__()
-        self.repos = repos
+        # Stored once as a tuple and shared with the ActionResult, never copied
+        self.repos: tuple[tuple[str, str], ...] = tuple(repos)
         self.scope_description = scope_description
-        self.options = ActionOptions()
+        self.options = DEFAULT_OPTIONS
+        # Widgets looked up once on mount (or registered when their options
+        # section is built), instead of a DOM query per event
+        # Weak, so the modal's lookups never keep unmounted widgets alive
+        self._checkboxes: WeakValueDictionary[str, Checkbox] = WeakValueDictionary()
+        self._radio_sets: WeakValueDictionary[str, RadioSet] = WeakValueDictionary()
+        self._sections: WeakValueDictionary[str, Vertical] = WeakValueDictionary()
+        self._inputs: WeakValueDictionary[str, Input] = WeakValueDictionary()
+        self._built_sections: set[str] = set()
 
     def compose(self) -> ComposeResult:
         """Compose the action modal."""
@@ -102,7 +237,7 @@ class ActionModal(ModalScreen[ActionResult | None]):
             ),
             VerticalScroll(
                 # Action selection
-                Static("[bold]Select Actions[/bold]", classes="section-header", markup=True),
+                Static("[bold]Select Actions[/bold]", classes=_SECTION_HEADER, markup=True),
                 Checkbox("Generate Descriptions", id="action-describe"),
                 Checkbox("Generate README", id="action-readme"),
                 Checkbox("Add License", id="action-license"),
@@ -112,102 +247,14 @@ class ActionModal(ModalScreen[ActionResult | None]):
                 Checkbox("Audit", id="action-audit"),
 
                 # Common options
-                Static("[bold]Common Options[/bold]", classes="section-header", markup=True),
+                Static("[bold]Common Options[/bold]", classes=_SECTION_HEADER, markup=True),
                 Checkbox("Dry Run (preview only)", id="opt-dry-run", value=True),
 
-                # Describe options
-                Static("[bold]Description Options[/bold]", id="describe-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("Model:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("Haiku (fast)", id="model-haiku", value=True),
-                        RadioButton("Sonnet (balanced)", id="model-sonnet"),
-                        RadioButton("Opus (best)", id="model-opus"),
-                        id="describe-model",
-                        classes="model-select",
-                    ),
-                    classes="field-row",
-                ),
-                Checkbox("Force update existing", id="describe-force", classes="hidden-option"),
-
-                # Tag options
-                Static("[bold]Topic Options[/bold]", id="tag-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("Model:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("Haiku (fast)", id="tag-model-haiku", value=True),
-                        RadioButton("Sonnet (balanced)", id="tag-model-sonnet"),
-                        id="tag-model",
-                        classes="model-select",
-                    ),
-                    classes="field-row",
-                ),
-                Horizontal(
-                    Label("Preferred tags:", classes="field-label"),
-                    Input(placeholder="edtech: Educational, tool: CLI tools", id="tag-preferred"),
-                    classes="field-row",
-                ),
-                Checkbox("Force update existing", id="tag-force", classes="hidden-option"),
-
-                # Badges options
-                Static("[bold]Badge Options[/bold]", id="badges-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("Style:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("flat-square", id="style-flat-square", value=True),
-                        RadioButton("flat", id="style-flat"),
-                        RadioButton("for-the-badge", id="style-badge"),
-                        id="badges-style",
-                        classes="style-select",
-                    ),
-                    classes="field-row",
-                ),
-                Checkbox("Apply to README files", id="badges-apply", classes="hidden-option"),
-
-                # Health options
-                Static("[bold]Health Check Options[/bold]", id="health-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("Rule set:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("Default", id="rules-default", value=True),
-                        RadioButton("Academic", id="rules-academic"),
-                        RadioButton("Professional", id="rules-professional"),
-                        id="health-rules",
-                        classes="rules-select",
-                    ),
-                    classes="field-row",
-                ),
-
-                # README options
-                Static("[bold]README Options[/bold]", id="readme-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("Model:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("Haiku (fast)", id="readme-model-haiku", value=True),
-                        RadioButton("Sonnet (balanced)", id="readme-model-sonnet"),
-                        RadioButton("Opus (best)", id="readme-model-opus"),
-                        id="readme-model",
-                        classes="model-select",
-                    ),
-                    classes="field-row",
+                # Per-action options, built the first time the action is selected
+                *(
+                    Vertical(id=f"{name}-options", classes="option-section hidden")
+                    for name in _SECTION_ORDER
                 ),
-                Checkbox("Force update all READMEs", id="readme-force", classes="hidden-option"),
-
-                # License options
-                Static("[bold]License Options[/bold]", id="license-section", classes="section-header hidden", markup=True),
-                Horizontal(
-                    Label("License:", classes="field-label"),
-                    RadioSet(
-                        RadioButton("MIT", id="license-mit", value=True),
-                        RadioButton("Apache 2.0", id="license-apache"),
-                        RadioButton("GPL 3.0", id="license-gpl"),
-                        RadioButton("BSD 3-Clause", id="license-bsd"),
-                        id="license-type",
-                        classes="style-select",
-                    ),
-                    classes="field-row",
-                ),
-                Checkbox("Replace existing licenses", id="license-force", classes="hidden-option"),
 
                 id="action-scroll",
                 classes="action-form",
@@ -221,8 +268,14 @@ class ActionModal(ModalScreen[ActionResult | None]):
         )
 
     def on_mount(self) -> None:
-        """Focus the first checkbox on mount."""
-        self.query_one("#action-describe", Checkbox).focus()
+        """Cache widget references and focus the first checkbox."""
+        self._checkboxes.update((cb.id, cb) for cb in self.query(Checkbox) if cb.id)
+        self._radio_sets.update((rs.id, rs) for rs in self.query(RadioSet) if rs.id)
+        self._sections.update(
+            (f"action-{name}", self.query_one(f"#{name}-options", Vertical))
+            for name in _SECTION_ORDER
+        )
+        self._checkboxes["action-describe"].focus()
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox changes to show/hide option sections."""
@@ -230,42 +283,70 @@ class ActionModal(ModalScreen[ActionResult | None]):
         if checkbox_id is None:
             return
 
-        # Map action checkboxes to their option sections
-        section_map = {
-            "action-describe": ["describe-section", "describe-force"],
-            "action-readme": ["readme-section", "readme-force"],
-            "action-license": ["license-section", "license-force"],
-            "action-tag": ["tag-section", "tag-force"],
-            "action-badges": ["badges-section", "badges-apply"],
-            "action-health": ["health-section"],
-        }
-
-        if checkbox_id in section_map:
-            for element_id in section_map[checkbox_id]:
-                try:
-                    element = self.query_one(f"#{element_id}")
-                    if event.value:
-                        element.remove_class("hidden")
-                    else:
-                        element.add_class("hidden")
-                except Exception:
-                    pass
-
-        # Show model options for describe/tag together
-        if checkbox_id in ("action-describe", "action-tag"):
-            describe_checked = self.query_one("#action-describe", Checkbox).value
-            tag_checked = self.query_one("#action-tag", Checkbox).value
-            # Model options are shown if either is checked
-            model_visible = describe_checked or tag_checked
-            for element_id in ["describe-section"]:
-                try:
-                    element = self.query_one(f"#{element_id}")
-                    if model_visible:
-                        element.remove_class("hidden")
-                    else:
-                        element.add_class("hidden")
-                except Exception:
-                    pass
+        section = self._sections.get(checkbox_id)
+        if section is None:
+            return
+        if event.value and checkbox_id not in self._built_sections:
+            self._built_sections.add(checkbox_id)
+            section.mount(*self._build_section(checkbox_id))
+        section.set_class(not event.value, "hidden")
+
+    def _register[W: Widget](self, widget: W) -> W:
+        """Record a lazily built checkbox, radio set or input for later lookups."""
+        if isinstance(widget, Checkbox) and widget.id:
+            self._checkboxes[widget.id] = widget
+        elif isinstance(widget, RadioSet) and widget.id:
+            self._radio_sets[widget.id] = widget
+        elif isinstance(widget, Input) and widget.id:
+            self._inputs[widget.id] = widget
+        return widget
+
+    def _radio_row(
+        self,
+        label: str,
+        radio_set_id: str,
+        buttons: _Buttons,
+        classes: str,
+    ) -> Horizontal:
+        """Build a labelled radio set row from its button spec."""
+        radio_set = self._register(
+            RadioSet(
+                *(
+                    RadioButton(text, id=button_id, value=pressed)
+                    for text, button_id, pressed in buttons
+                ),
+                id=radio_set_id,
+                classes=classes,
+            )
+        )
+        return Horizontal(
+            Label(label, classes=_FIELD_LABEL), radio_set, classes=_FIELD_ROW
+        )
+
+    def _build_section(self, checkbox_id: str) -> list[Widget]:
+        """Build the option widgets for an action's section."""
+        title, radio_row, checkbox = _SECTION_SPECS[checkbox_id]
+        widgets: list[Widget] = [
+            Static(f"[bold]{title}[/bold]", classes=_SECTION_HEADER, markup=True),
+            self._radio_row(*radio_row),
+        ]
+        if checkbox_id == "action-tag":
+            widgets.append(
+                Horizontal(
+                    Label("Preferred tags:", classes=_FIELD_LABEL),
+                    self._register(
+                        Input(
+                            placeholder="edtech: Educational, tool: CLI tools",
+                            id="tag-preferred",
+                        )
+                    ),
+                    classes=_FIELD_ROW,
+                )
+            )
+        if checkbox is not None:
+            text, widget_id = checkbox
+            widgets.append(self._register(Checkbox(text, id=widget_id)))
+        return widgets
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -282,100 +363,20 @@ class ActionModal(ModalScreen[ActionResult | None]):
         """Execute selected actions."""
         self._execute_actions()
 
-    def _get_selected_actions(self) -> list[str]:
-        """Get list of selected action names."""
-        actions = []
-        action_checkboxes = [
-            ("action-describe", "describe"),
-            ("action-readme", "readme"),
-            ("action-license", "license"),
-            ("action-tag", "tag"),
-            ("action-badges", "badges"),
-            ("action-health", "health"),
-            ("action-audit", "audit"),
-        ]
-        for checkbox_id, action_name in action_checkboxes:
-            try:
-                checkbox = self.query_one(f"#{checkbox_id}", Checkbox)
-                if checkbox.value:
-                    actions.append(action_name)
-            except Exception:
-                pass
-        return actions
-
-    def _get_model_name(self, radio_set_id: str) -> str:
-        """Get the selected model name from a radio set."""
-        model_map = {
-            "model-haiku": "claude-3-haiku-20240307",
-            "tag-model-haiku": "claude-3-haiku-20240307",
-            "readme-model-haiku": "claude-3-haiku-20240307",
-            "model-sonnet": "claude-sonnet-4-20250514",
-            "tag-model-sonnet": "claude-sonnet-4-20250514",
-            "readme-model-sonnet": "claude-sonnet-4-20250514",
-            "model-opus": "claude-opus-4-20250514",
-            "readme-model-opus": "claude-opus-4-20250514",
-        }
-        try:
-            radio_set = self.query_one(f"#{radio_set_id}", RadioSet)
-            if radio_set.pressed_button:
-                button_id = radio_set.pressed_button.id
-                if button_id:
-                    return model_map.get(button_id, "claude-3-haiku-20240307")
-        except Exception:
-            pass
-        return "claude-3-haiku-20240307"
-
-    def _get_badge_style(self) -> str:
-        """Get the selected badge style."""
-        style_map = {
-            "style-flat-square": "flat-square",
-            "style-flat": "flat",
-            "style-badge": "for-the-badge",
-        }
-        try:
-            radio_set = self.query_one("#badges-style", RadioSet)
-            if radio_set.pressed_button:
-                button_id = radio_set.pressed_button.id
-                if button_id:
-                    return style_map.get(button_id, "flat-square")
-        except Exception:
-            pass
-        return "flat-square"
-
-    def _get_health_rules(self) -> str:
-        """Get the selected health check rule set."""
-        rules_map = {
-            "rules-default": "default",
-            "rules-academic": "academic",
-            "rules-professional": "professional",
-        }
-        try:
-            radio_set = self.query_one("#health-rules", RadioSet)
-            if radio_set.pressed_button:
-                button_id = radio_set.pressed_button.id
-                if button_id:
-                    return rules_map.get(button_id, "default")
-        except Exception:
-            pass
-        return "default"
-
-    def _get_license_type(self) -> str:
-        """Get the selected license type."""
-        license_map = {
-            "license-mit": "mit",
-            "license-apache": "apache-2.0",
-            "license-gpl": "gpl-3.0",
-            "license-bsd": "bsd-3-clause",
-        }
-        try:
-            radio_set = self.query_one("#license-type", RadioSet)
-            if radio_set.pressed_button:
-                button_id = radio_set.pressed_button.id
-                if button_id:
-                    return license_map.get(button_id, "mit")
-        except Exception:
-            pass
-        return "mit"
+    def _get_selected_actions(self) -> tuple[str, ...]:
+        """Get the selected action names."""
+        return tuple(
+            name for checkbox_id, name in _ACTION_IDS if self._checkboxes[checkbox_id].value
+        )
+
+    def _resolve_radio(
+        self, radio_set_id: str, mapping: dict[str, str], default: str
+    ) -> str:
+        """Map the pressed button of a radio set to its option value."""
+        button = self._radio_sets[radio_set_id].pressed_button
+        if button is not None and button.id:
+            return mapping.get(button.id, default)
+        return default
 
     def _execute_actions(self) -> None:
         """Gather options and execute selected actions."""
@@ -385,69 +386,70 @@ class ActionModal(ModalScreen[ActionResult | None]):
             self.app.notify("No actions selected", severity="warning", timeout=2)
             return
 
-        # Gather options
+        try:
+            options = self._gather_options(actions)
+        except (KeyError, AttributeError) as e:
+            # Never run actions on partial options; a missing widget is a bug
+            self.app.notify(f"Could not read options: {e}", severity="error", timeout=3)
+            self.dismiss(None)
+            return
+
+        result = ActionResult(
+            actions=actions,
+            repos=self.repos,
+            options=options,
+            dry_run=options.get("dry_run", True),
+        )
+
+        self.dismiss(result)
+
+    def _gather_options(self, actions: tuple[str, ...]) -> dict[str, Any]:
+        """Read the option values for the selected actions from their widgets."""
         options: dict[str, Any] = {}
 
         # Common
-        try:
-            options["dry_run"] = self.query_one("#opt-dry-run", Checkbox).value
-        except Exception:
-            options["dry_run"] = True
+        options["dry_run"] = self._checkboxes["opt-dry-run"].value
 
         # Describe options
         if "describe" in actions:
-            options["describe_model"] = self._get_model_name("describe-model")
-            try:
-                options["describe_force"] = self.query_one("#describe-force", Checkbox).value
-            except Exception:
-                options["describe_force"] = False
+            options["describe_model"] = self._resolve_radio(
+                "describe-model", _MODEL_NAMES, DEFAULT_MODEL
+            )
+            options["describe_force"] = self._checkboxes["describe-force"].value
 
         # Tag options
         if "tag" in actions:
-            options["tag_model"] = self._get_model_name("tag-model")
-            try:
-                options["tag_force"] = self.query_one("#tag-force", Checkbox).value
-            except Exception:
-                options["tag_force"] = False
-            try:
-                options["tag_preferred"] = self.query_one("#tag-preferred", Input).value
-            except Exception:
-                options["tag_preferred"] = ""
+            options["tag_model"] = self._resolve_radio(
+                "tag-model", _MODEL_NAMES, DEFAULT_MODEL
+            )
+            options["tag_force"] = self._checkboxes["tag-force"].value
+            options["tag_preferred"] = self._inputs["tag-preferred"].value
 
         # Badges options
         if "badges" in actions:
-            options["badges_style"] = self._get_badge_style()
-            try:
-                options["badges_apply"] = self.query_one("#badges-apply", Checkbox).value
-            except Exception:
-                options["badges_apply"] = False
+            options["badges_style"] = self._resolve_radio(
+                "badges-style", _BADGE_STYLES, "flat-square"
+            )
+            options["badges_apply"] = self._checkboxes["badges-apply"].value
 
         # Health options
         if "health" in actions:
-            options["health_rules"] = self._get_health_rules()
+            options["health_rules"] = self._resolve_radio(
+                "health-rules", _HEALTH_RULES, "default"
+            )
 
         # README options
         if "readme" in actions:
-            options["readme_model"] = self._get_model_name("readme-model")
-            try:
-                options["readme_force"] = self.query_one("#readme-force", Checkbox).value
-            except Exception:
-                options["readme_force"] = False
+            options["readme_model"] = self._resolve_radio(
+                "readme-model", _MODEL_NAMES, DEFAULT_MODEL
+            )
+            options["readme_force"] = self._checkboxes["readme-force"].value
 
         # License options
         if "license" in actions:
-            options["license_type"] = self._get_license_type()
-            try:
-                options["license_force"] = self.query_one("#license-force", Checkbox).value
-            except Exception:
-                options["license_force"] = False
+            options["license_type"] = self._resolve_radio(
+                "license-type", _LICENSE_TYPES, "mit"
+            )
+            options["license_force"] = self._checkboxes["license-force"].value
 
-        # Create result with first action (we'll handle multiple actions in executor)
-        result = ActionResult(
-            action=",".join(actions),
-            repos=self.repos,
-            options=options,
-            dry_run=options.get("dry_run", True),
-        )
-
-        self.dismiss(result)
+        return options
@@ -0,0 +1,243 @@
+"""Virtualized list widget that only renders the rows in view."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+_sub_control = re.compile("[\u0000-\u001f]").sub
+
+
+class VirtualList(ScrollView, can_focus=True):
+    """A cursor-driven list backed by a plain list of row objects.
+
+    Unlike ListView, no widget is created per row: each visible line is
+    rendered on demand from ``row_formatter``, so mount time and memory stay
+    constant regardless of how many rows the list holds.
+    """
+
+    COMPONENT_CLASSES = {"virtual-list--cursor", "virtual-list--hover"}
+
+    DEFAULT_CSS = """
+    VirtualList {
+        overflow-x: hidden;
+    }
+
+    VirtualList > .virtual-list--cursor {
+        background: $primary;
+    }
+
+    VirtualList > .virtual-list--hover {
+        background: $primary-darken-1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+    ]
+
+    index: reactive[int | None] = reactive[int | None](None)
+    """Index of the row under the cursor, or None if the list is empty."""
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to a different row."""
+
+        def __init__(
+            self, virtual_list: VirtualList, row: Any | None, index: int | None
+        ) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.row = row
+            self.index = index
+
+        @property
+        def control(self) -> VirtualList:
+            """The list that sent the message."""
+            return self.virtual_list
+
+    class Selected(Message):
+        """Posted when a row is chosen with Enter or a click."""
+
+        def __init__(
+            self, virtual_list: VirtualList, row: Any, index: int
+        ) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.row = row
+            self.index = index
+
+        @property
+        def control(self) -> VirtualList:
+            """The list that sent the message."""
+            return self.virtual_list
+
+    def __init__(
+        self,
+        row_formatter: Callable[[Any], str],
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        """Initialize the list.
+
+        Args:
+            row_formatter: Returns the display text for a row; called at render time
+            name: The name of the widget
+            id: The ID of the widget in the DOM
+            classes: The CSS classes of the widget
+        """
+        super().__init__(name=name, id=id, classes=classes)
+        self._row_formatter = row_formatter
+        self._rows: list[Any] = []
+        self._hover_index: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def rows(self) -> list[Any]:
+        """The rows currently shown in the list."""
+        return self._rows
+
+    @property
+    def highlighted_row(self) -> Any | None:
+        """The row under the cursor, if any."""
+        if self.index is None:
+            return None
+        return self._rows[self.index]
+
+    def set_rows(self, rows: list[Any], keep_row: Any | None = None) -> None:
+        """Replace the rows shown in the list and reset the cursor.
+
+        Args:
+            rows: Rows to display, in order
+            keep_row: Row to leave the cursor on, at the same height in the
+                view, if it is in ``rows`` (matched by identity)
+        """
+        offset = (self.index or 0) - round(self.scroll_y)
+        self._rows = rows
+        self._hover_index = None
+        self.virtual_size = Size(0, len(rows))
+        new_index = None
+        if keep_row is not None:
+            new_index = next((i for i, row in enumerate(rows) if row is keep_row), None)
+        if new_index is None:
+            self.index = 0 if rows else None
+            self.scroll_home(animate=False)
+        else:
+            self.scroll_to(y=max(0, new_index - offset), animate=False)
+            self.index = new_index
+        self.refresh()
+
+    def refresh_rows(self) -> None:
+        """Repaint visible rows after their display state changed."""
+        self.refresh()
+
+    def validate_index(self, index: int | None) -> int | None:
+        """Clamp the cursor to the available rows."""
+        if index is None or not self._rows:
+            return None
+        return max(0, min(index, len(self._rows) - 1))
+
+    def watch_index(self, old_index: int | None, new_index: int | None) -> None:
+        """Keep the cursor row visible and announce the change."""
+        self.refresh()
+        if new_index is not None:
+            self.scroll_to_region(
+                Region(0, new_index, self.scrollable_content_region.width, 1),
+                animate=False,
+            )
+        self.post_message(self.Highlighted(self, self.highlighted_row, new_index))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible line from the backing rows."""
+        scroll_x, scroll_y = self.scroll_offset
+        row_index = scroll_y + y
+        width = self.scrollable_content_region.width
+        base_style = self.rich_style
+
+        if row_index >= len(self._rows):
+            return Strip.blank(width, base_style)
+
+        style = base_style
+        if row_index == self.index:
+            style += self.get_component_rich_style("virtual-list--cursor")
+        elif row_index == self._hover_index:
+            style += self.get_component_rich_style("virtual-list--hover")
+        style += Style(meta={"row": row_index})
+
+        text = _sub_control(" ", self._row_formatter(self._rows[row_index]))
+        strip = Strip([Segment(text, style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+    def action_cursor_up(self) -> None:
+        """Move the cursor up one row."""
+        if self.index is not None:
+            self.index -= 1
+
+    def action_cursor_down(self) -> None:
+        """Move the cursor down one row."""
+        if self.index is None:
+            self.index = 0
+        else:
+            self.index += 1
+
+    def action_page_up(self) -> None:
+        """Move the cursor up one page."""
+        if self.index is not None:
+            self.index -= max(1, self.scrollable_content_region.height)
+
+    def action_page_down(self) -> None:
+        """Move the cursor down one page."""
+        self.index = (self.index or 0) + max(1, self.scrollable_content_region.height)
+
+    def action_first(self) -> None:
+        """Move the cursor to the first row."""
+        self.index = 0
+
+    def action_last(self) -> None:
+        """Move the cursor to the last row."""
+        self.index = len(self._rows) - 1
+
+    def action_select_cursor(self) -> None:
+        """Select the row under the cursor."""
+        if self.index is not None:
+            self.post_message(self.Selected(self, self._rows[self.index], self.index))
+
+    def _on_click(self, event: events.Click) -> None:
+        """Move the cursor to the clicked row and select it."""
+        row_index: int | None = event.style.meta.get("row")
+        if row_index is not None and row_index < len(self._rows):
+            self.index = row_index
+            self.action_select_cursor()
+
+    def _on_mouse_move(self, event: events.MouseMove) -> None:
+        """Track the row under the mouse for hover styling."""
+        row_index: int | None = event.style.meta.get("row")
+        if row_index != self._hover_index:
+            self._hover_index = row_index
+            self.refresh()
+
+    def _on_leave(self, _: events.Leave) -> None:
+        """Clear hover styling when the mouse leaves."""
+        if self._hover_index is not None:
+            self._hover_index = None
+            self.refresh()
@@ -1,15 +1,75 @@
 """Pytest configuration and shared fixtures."""
 
+import json
+from pathlib import Path
+
 import pytest
+import requests
 import responses
+from typer.testing import CliRunner
 
+from gh_toolkit.core.github_client import GitHubClient
 
-@pytest.fixture
+try:
+    import orjson
+
+    dump_json = orjson.dumps
+    load_json = orjson.loads
+except ImportError:  # orjson is optional (tui extra); fall back to the stdlib codec
+
+    def dump_json(data):
+        return json.dumps(data).encode()
+
+    load_json = json.loads
+
+# Recorded API payloads, one JSON file per response body
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# Fixtures that patch requests with a responses mock
+HTTP_MOCK_FIXTURES = {"rsps", "gh_mock", "mock_github_api"}
+
+
+def pytest_collection_modifyitems(items):
+    """Mark tests that mock HTTP with `http`, so they can be run as their own job."""
+    for item in items:
+        function = getattr(item, "function", None)
+        # responses.activate wraps the test in a function defined by responses
+        activated = (
+            function is not None
+            and function.__code__.co_filename == responses.__file__
+        )
+        if activated or HTTP_MOCK_FIXTURES.intersection(item.fixturenames):
+            item.add_marker(pytest.mark.http)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide one CLI runner for all tests (invoke keeps no state between calls)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """One requests session for the shared test clients (all use the mock token)."""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
 def mock_github_token():
     """Provide a mock GitHub token for testing."""
     return "ghp_mock_token_1234567890abcdef"
 
 
+@pytest.fixture(scope="module")
+def gh_client(mock_github_token, http_session):
+    """GitHubClient with the mock token, built once per test module.
+
+    Tests may mock its HTTP traffic but must not change the client itself.
+    """
+    return GitHubClient(mock_github_token, session=http_session)
+
+
 @pytest.fixture
 def mock_anthropic_key():
     """Provide a mock Anthropic API key for testing."""
@@ -128,12 +188,54 @@ def mock_github_api():
 
 
 @pytest.fixture
-def mock_anthropic_client(mocker):
+def rsps():
+    """Mock requests without checking that every registered response was hit."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def cassettes():
+    """Recorded API payloads from CASSETTE_DIR, keyed by file stem.
+
+    Parsed once per session; tests register them with `rsps.add(..., json=...)`.
+    """
+    return {
+        path.stem: load_json(path.read_bytes()) for path in CASSETTE_DIR.glob("*.json")
+    }
+
+
+@pytest.fixture
+def gh_mock(rsps):
+    """Mock GitHub API with endpoints most repo tests share pre-registered.
+
+    Tests add their own responses to the returned mock.
+    """
+    # testuser/test-repo has no README
+    rsps.add(
+        responses.GET,
+        "https://api.github.com/repos/testuser/test-repo/readme",
+        status=404,
+    )
+    return rsps
+
+
+@pytest.fixture
+def anthropic_mock(mocker):
+    """Factory for mock Anthropic clients whose messages reply with the given text."""
+
+    def make(text):
+        mock_client = mocker.Mock()
+        mock_client.messages.create.return_value.content = [mocker.Mock(text=text)]
+        return mock_client
+
+    return make
+
+
+@pytest.fixture
+def mock_anthropic_client(anthropic_mock, mocker):
     """Mock Anthropic client for testing LLM functionality."""
-    mock_client = mocker.Mock()
-    mock_response = mocker.Mock()
-    mock_response.content = [mocker.Mock(text="python, cli, tool, testing, automation")]
-    mock_client.messages.create.return_value = mock_response
+    mock_client = anthropic_mock("python, cli, tool, testing, automation")
 
     # Use mocker.patch instead of patch
     mocker.patch("gh_toolkit.core.topic_tagger.Anthropic", return_value=mock_client)
@@ -185,6 +287,59 @@ def sample_extracted_repos():
     ]
 
 
+@pytest.fixture(scope="session")
+def site_repos_json():
+    """One-repo site generation data, serialized once per session for stdin."""
+    repos_data = [
+        {
+            "name": "test-repo",
+            "description": "A test repository",
+            "url": "https://github.com/user/test-repo",
+            "stars": 10,
+            "forks": 2,
+            "category": "Python Package",
+            "topics": ["python", "test"],
+            "languages": ["Python"],
+            "license": "MIT",
+        }
+    ]
+    return dump_json(repos_data).decode()
+
+
+@pytest.fixture(scope="session")
+def extracted_repos_file(tmp_path_factory):
+    """Write mock `repo extract` output once per session."""
+    extracted_data = [
+        {
+            "name": "python-cli",
+            "description": "A Python CLI tool",
+            "url": "https://github.com/user/python-cli",
+            "stars": 25,
+            "forks": 5,
+            "category": "Desktop Application",
+            "category_confidence": 0.85,
+            "topics": ["python", "cli", "tool"],
+            "languages": ["Python", "Shell"],
+            "license": "MIT",
+        },
+        {
+            "name": "web-dashboard",
+            "description": "A React dashboard application",
+            "url": "https://github.com/user/web-dashboard",
+            "stars": 67,
+            "forks": 12,
+            "category": "Web Application",
+            "category_confidence": 0.92,
+            "topics": ["react", "dashboard", "web"],
+            "languages": ["JavaScript", "CSS", "HTML"],
+            "license": "Apache-2.0",
+        },
+    ]
+    data_file = tmp_path_factory.mktemp("data") / "extracted_repos.json"
+    data_file.write_bytes(dump_json(extracted_data))
+    return data_file
+
+
 @pytest.fixture
 def sample_site_metadata():
     """Sample metadata for site generation."""
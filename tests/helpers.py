@@ -0,0 +1,11 @@
+"""Assertion helpers shared by the test suites."""
+
+import re
+
+
+def assert_all_in(text, needles):
+    """Assert every needle occurs in text, scanning it once in the usual case."""
+    found = set(re.findall("|".join(map(re.escape, needles)), text))
+    # Matches don't overlap, so recheck any needle that only occurs inside another
+    missing = [n for n in needles if n not in found and n not in text]
+    assert not missing, f"missing {missing}"
@@ -2,25 +2,21 @@
 
 from pathlib import Path
 
-from typer.testing import CliRunner
-
 from gh_toolkit.cli import app
 
 
 class TestPageCommands:
     """Test page generation CLI commands."""
 
-    def test_page_help(self):
+    def test_page_help(self, runner):
         """Test page subcommand help."""
-        runner = CliRunner()
         result = runner.invoke(app, ["page", "--help"])
 
         assert result.exit_code == 0
         assert "Page generation commands" in result.stdout
 
-    def test_page_generate_help(self):
+    def test_page_generate_help(self, runner):
         """Test page generate command help."""
-        runner = CliRunner()
         result = runner.invoke(app, ["page", "generate", "--help"])
 
         assert result.exit_code == 0
@@ -29,9 +25,8 @@ class TestPageCommands:
         assert "--title" in result.stdout
         assert "--description" in result.stdout
 
-    def test_page_generate_missing_file(self):
+    def test_page_generate_missing_file(self, runner):
         """Test page generate with missing README file."""
-        runner = CliRunner()
         result = runner.invoke(app, ["page", "generate", "nonexistent.md"])
 
         # Typer returns exit code 2 for file validation errors
@@ -39,7 +34,7 @@ class TestPageCommands:
         # Error message is in stderr for typer validation errors
         assert "does not exist" in result.output
 
-    def test_page_generate_html_mode(self, tmp_path):
+    def test_page_generate_html_mode(self, runner, tmp_path):
         """Test HTML page generation."""
         # Create test README
         readme_content = """# Awesome Project
@@ -73,7 +68,6 @@ MIT License
 
         output_file = tmp_path / "output.html"
 
-        runner = CliRunner()
         result = runner.invoke(
             app, ["page", "generate", str(readme_file), "--output", str(output_file)]
         )
@@ -90,7 +84,7 @@ MIT License
         assert "Installation" in content
         assert "tailwindcss" in content or "Tailwind" in content
 
-    def test_page_generate_jekyll_mode(self, tmp_path):
+    def test_page_generate_jekyll_mode(self, runner, tmp_path):
         """Test Jekyll markdown generation."""
         # Create test README
         readme_content = """# Jekyll Project
@@ -110,7 +104,6 @@ Configure your Jekyll site.
 
         output_file = tmp_path / "index.md"
 
-        runner = CliRunner()
         result = runner.invoke(
             app,
             [
@@ -135,7 +128,7 @@ Configure your Jekyll site.
         assert "description: A project designed for Jekyll integration." in content
         assert "Getting Started" in content
 
-    def test_page_generate_auto_output(self, tmp_path):
+    def test_page_generate_auto_output(self, runner, tmp_path):
         """Test automatic output file detection."""
         # Create test README
         readme_content = """# Auto Output Test
@@ -156,7 +149,6 @@ Testing automatic output file detection.
 
             os.chdir(tmp_path)
 
-            runner = CliRunner()
             result = runner.invoke(app, ["page", "generate", "README.md"])
 
             assert result.exit_code == 0
@@ -169,7 +161,7 @@ Testing automatic output file detection.
         finally:
             os.chdir(original_cwd)
 
-    def test_page_generate_jekyll_auto_output(self, tmp_path):
+    def test_page_generate_jekyll_auto_output(self, runner, tmp_path):
         """Test automatic output with Jekyll mode."""
         # Create test README
         readme_content = """# Jekyll Auto Test
@@ -190,7 +182,6 @@ Some content here.
 
             os.chdir(tmp_path)
 
-            runner = CliRunner()
             result = runner.invoke(app, ["page", "generate", "README.md", "--jekyll"])
 
             assert result.exit_code == 0
@@ -206,7 +197,7 @@ Some content here.
         finally:
             os.chdir(original_cwd)
 
-    def test_page_generate_custom_title_description(self, tmp_path):
+    def test_page_generate_custom_title_description(self, runner, tmp_path):
         """Test custom title and description override."""
         readme_content = """# Original Title
 
@@ -221,7 +212,6 @@ Content here.
 
         output_file = tmp_path / "custom.md"
 
-        runner = CliRunner()
         result = runner.invoke(
             app,
             [
@@ -245,7 +235,7 @@ Content here.
         assert "title: Custom Title" in content
         assert "description: Custom description text" in content
 
-    def test_page_generate_with_github_links(self, tmp_path):
+    def test_page_generate_with_github_links(self, runner, tmp_path):
         """Test page generation with GitHub links."""
         readme_content = """# Project with Links
 
@@ -266,7 +256,6 @@ Visit the [documentation](https://user.github.io/project).
 
         output_file = tmp_path / "linked.html"
 
-        runner = CliRunner()
         result = runner.invoke(
             app, ["page", "generate", str(readme_file), "--output", str(output_file)]
         )
@@ -280,7 +269,7 @@ Visit the [documentation](https://user.github.io/project).
         assert "use this template" in content
         assert "documentation" in content
 
-    def test_page_generate_complex_markdown(self, tmp_path):
+    def test_page_generate_complex_markdown(self, runner, tmp_path):
         """Test with complex markdown features."""
         readme_content = """# Complex Project
 
@@ -321,7 +310,6 @@ MIT License - see [LICENSE](LICENSE) file.
 
         output_file = tmp_path / "complex.html"
 
-        runner = CliRunner()
         result = runner.invoke(
             app, ["page", "generate", str(readme_file), "--output", str(output_file)]
         )
@@ -0,0 +1,139 @@
+"""Unit tests for the TUI ActionExecutor."""
+
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("textual")
+
+import gh_toolkit.tui.widgets.action_executor  # noqa: E402
+from gh_toolkit.core.health_checker import (  # noqa: E402
+    HealthCheck,
+    HealthReport,
+    RepositoryHealthChecker,
+)
+from gh_toolkit.tui.widgets.action_executor import (  # noqa: E402
+    DEFAULT_MAX_WORKERS,
+    ActionExecutor,
+    _max_workers_from_env,
+    _store_repo_data,
+)
+from gh_toolkit.tui.widgets.action_modal import ActionResult  # noqa: E402
+
+
+def make_check(name, passed):
+    """Build a health check worth 10 points, all awarded if it passed."""
+    return HealthCheck(
+        name=name,
+        category="documentation",
+        description=name,
+        passed=passed,
+        score=10 if passed else 0,
+        max_score=10,
+        message="",
+    )
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("8", 8),
+        ("0", 1),
+        ("-3", 1),
+        ("lots", DEFAULT_MAX_WORKERS),
+        ("", DEFAULT_MAX_WORKERS),
+    ],
+)
+def test_max_workers_from_env(monkeypatch, value, expected):
+    """GH_TOOLKIT_WORKERS is clamped to at least 1 and bad values use the default."""
+    monkeypatch.setenv("GH_TOOLKIT_WORKERS", value)
+
+    assert _max_workers_from_env() == expected
+
+
+def test_repo_data_cache_evicts_oldest(monkeypatch):
+    """The repo data cache drops its oldest entries once it is full."""
+    monkeypatch.setattr(
+        gh_toolkit.tui.widgets.action_executor, "REPO_DATA_CACHE_MAX_ENTRIES", 2
+    )
+    cache = OrderedDict()
+    monkeypatch.setattr(gh_toolkit.tui.widgets.action_executor, "_repo_data_cache", cache)
+    for i, name in enumerate(["a", "b", "a", "c"]):
+        _store_repo_data(("topics", "owner", name), float(i), [name])
+
+    # Re-storing "a" made "b" the oldest entry
+    assert list(cache) == [("topics", "owner", "a"), ("topics", "owner", "c")]
+
+
+def test_repo_changing_action_clears_repo_data(monkeypatch):
+    """Actions that may modify repos drop the cached repo data."""
+    cache = OrderedDict()
+    monkeypatch.setattr(gh_toolkit.tui.widgets.action_executor, "_repo_data_cache", cache)
+    _store_repo_data(("topics", "owner", "repo"), 0.0, ["python"])
+    action = ActionResult(actions=("rename",), repos=(("owner", "repo"),), options={})
+
+    assert ActionExecutor().execute(action) == []
+    assert not cache
+
+
+class TestActionExecutor:
+    """Test ActionExecutor actions."""
+
+    def test_reads_credentials_when_created(self, monkeypatch):
+        """Tokens set after import are picked up by new executors."""
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_later")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-later")
+
+        executor = ActionExecutor()
+
+        assert executor.github_token == "ghp_later"
+        assert executor.anthropic_key == "sk-later"
+
+    def test_health_reports_score_and_grade(self, mocker):
+        """Health results carry each repo's grade, percentage and check counts."""
+        report = HealthReport(
+            repository="owner/repo",
+            total_score=20,
+            max_score=30,
+            percentage=66.7,
+            grade="C",
+            checks=[
+                make_check("readme", True),
+                make_check("license", True),
+                make_check("tests", False),
+            ],
+            summary={},
+        )
+        check = mocker.patch.object(
+            RepositoryHealthChecker, "check_repository_health", return_value=report
+        )
+        action = ActionResult(actions=("health",), repos=(("owner", "repo"),), options={})
+
+        [result] = ActionExecutor().execute(action)
+
+        check.assert_called_once_with("owner/repo")
+        assert (result.success_count, result.error_count) == (1, 0)
+        assert result.results == (
+            {
+                "repo": "owner/repo",
+                "status": "success",
+                "score": 67,
+                "grade": "C",
+                "passed": 2,
+                "failed": 1,
+            },
+        )
+
+    def test_health_error_is_reported_per_repo(self, mocker):
+        """A failing health check becomes an error result, not an exception."""
+        mocker.patch.object(
+            RepositoryHealthChecker,
+            "check_repository_health",
+            side_effect=RuntimeError("boom"),
+        )
+        action = ActionResult(actions=("health",), repos=(("owner", "repo"),), options={})
+
+        [result] = ActionExecutor().execute(action)
+
+        assert (result.success_count, result.error_count) == (0, 1)
+        assert str(result.results[0]["exception"]) == "boom"
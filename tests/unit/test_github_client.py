@@ -1,8 +1,10 @@
 """Unit tests for GitHubClient."""
 
+import json
 import time
 
 import pytest
+import requests
 import responses
 from requests.exceptions import RequestException
 
@@ -25,6 +27,34 @@ class TestGitHubClient:
         assert client.token is None
         assert "Authorization" not in client.headers
 
+    def test_init_pool_maxsize(self, mock_github_token):
+        """Test that the HTTPS connection pool is sized as requested."""
+        client = GitHubClient(mock_github_token, pool_maxsize=32)
+        adapter = client.session.get_adapter("https://api.github.com")
+        assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+
+    def test_init_with_session(self, mock_github_token):
+        """Test that a passed-in session is used without storing the token on it."""
+        session = requests.Session()
+        client = GitHubClient(mock_github_token, session=session)
+        assert client.session is session
+        assert "Authorization" not in session.headers
+
+    @responses.activate
+    def test_shared_session_sends_each_clients_token(
+        self, mock_github_token, no_env_vars
+    ):
+        """Test that a token-less client sharing a session sends no token."""
+        responses.add(responses.GET, "https://api.github.com/user", json={})
+        session = requests.Session()
+
+        GitHubClient(mock_github_token, session=session)._make_request("GET", "/user")
+        GitHubClient(session=session)._make_request("GET", "/user")
+
+        first, second = (call.request.headers for call in responses.calls)
+        assert first["Authorization"] == f"token {mock_github_token}"
+        assert "Authorization" not in second
+
     @responses.activate
     def test_make_request_success(self, mock_github_token):
         """Test successful API request."""
@@ -86,6 +116,47 @@ class TestGitHubClient:
         assert result["login"] == "testuser"
         mock_sleep.assert_called_once()
 
+    @responses.activate
+    def test_transient_error_retried(self, mock_github_token, mocker):
+        """Test that a GET returning 5xx is retried with backoff."""
+        responses.add(
+            responses.GET,
+            "https://api.github.com/user",
+            json={"message": "Service Unavailable"},
+            status=503,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.github.com/user",
+            json={"login": "testuser"},
+            status=200,
+        )
+
+        client = GitHubClient(mock_github_token)
+        mock_sleep = mocker.patch("time.sleep")
+        response = client._make_request("GET", "/user")
+        assert response.json()["login"] == "testuser"
+        mock_sleep.assert_called_once_with(0.5)
+
+    @responses.activate
+    def test_transient_error_not_retried_for_post(self, mock_github_token, mocker):
+        """Test that non-GET requests fail without retrying."""
+        responses.add(
+            responses.POST,
+            "https://api.github.com/orgs/testorg/repos",
+            json={"message": "Service Unavailable"},
+            status=503,
+        )
+
+        client = GitHubClient(mock_github_token)
+        mock_sleep = mocker.patch("time.sleep")
+        with pytest.raises(GitHubAPIError) as exc_info:
+            client._make_request("POST", "/orgs/testorg/repos", json_data={})
+
+        assert exc_info.value.status_code == 503
+        mock_sleep.assert_not_called()
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_get_user_info(self, mock_github_token):
         """Test getting user information."""
@@ -183,7 +254,7 @@ class TestGitHubClient:
             },
         )
 
-        # Page 2
+        # Page 2 has no rel="next" link, so pagination stops here
         responses.add(
             responses.GET,
             "https://api.github.com/users/testuser/repos",
@@ -191,18 +262,123 @@ class TestGitHubClient:
             status=200,
         )
 
-        # Page 3 returns empty to stop pagination
+        client = GitHubClient(mock_github_token)
+        result = client.get_user_repos("testuser")
+        assert len(result) == 3
+        assert [r["name"] for r in result] == ["repo1", "repo2", "repo3"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_all_pages_uses_last_link(self, mock_github_token):
+        """Test that remaining pages are fetched using the rel="last" link."""
+        url = "https://api.github.com/orgs/testorg/repos"
+        for page, names in ((1, ["repo1", "repo2"]), (2, ["repo3"]), (3, ["repo4"])):
+            responses.add(
+                responses.GET,
+                url,
+                json=[{"name": name} for name in names],
+                status=200,
+                headers={"Link": f'<{url}?per_page=100&page=3>; rel="last"'},
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"per_page": "100", "page": str(page)}
+                    )
+                ],
+            )
+
+        pages: list[list[str]] = []
+        client = GitHubClient(mock_github_token)
+        result = client.get_all_pages(
+            "/orgs/testorg/repos",
+            on_page=lambda items: pages.append([r["name"] for r in items]),
+        )
+        assert [r["name"] for r in result] == ["repo1", "repo2", "repo3", "repo4"]
+        assert pages == [["repo1", "repo2"], ["repo3"], ["repo4"]]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_get_all_pages_single_page(self, mock_github_token):
+        """Test that a response without a Link header is a single page."""
         responses.add(
             responses.GET,
-            "https://api.github.com/users/testuser/repos",
-            json=[],
+            "https://api.github.com/user/orgs",
+            json=[{"login": "org1"}],
             status=200,
         )
 
         client = GitHubClient(mock_github_token)
-        result = client.get_user_repos("testuser")
-        assert len(result) == 3
-        assert [r["name"] for r in result] == ["repo1", "repo2", "repo3"]
+        result = client.get_all_pages("/user/orgs")
+        assert result == [{"login": "org1"}]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_all_pages_reuses_cached_pages_on_304(self, mock_github_token):
+        """Test conditional page requests with a page cache."""
+        url = "https://api.github.com/orgs/testorg/repos"
+        for etag in ('"abc"', '"def"'):
+            responses.add(
+                responses.GET,
+                url,
+                status=304,
+                match=[responses.matchers.header_matcher({"If-None-Match": etag})],
+            )
+
+        page_cache = {
+            1: ('"abc"', [{"name": "repo1"}]),
+            2: ('"def"', [{"name": "repo2"}]),
+        }
+        client = GitHubClient(mock_github_token)
+        result = client.get_all_pages("/orgs/testorg/repos", page_cache=page_cache)
+        assert [r["name"] for r in result] == ["repo1", "repo2"]
+        assert len(responses.calls) == 2
+        assert page_cache[1] == ('"abc"', [{"name": "repo1"}])
+
+    @responses.activate
+    def test_get_repos_bulk(self, mock_github_token):
+        """Test that repos are fetched in one GraphQL request, skipping missing ones."""
+        responses.add(
+            responses.POST,
+            "https://api.github.com/graphql",
+            json={
+                "data": {
+                    "r0": {
+                        "description": "A repo",
+                        "licenseInfo": {"key": "mit"},
+                        "repositoryTopics": {"nodes": [{"topic": {"name": "python"}}]},
+                    },
+                    "r1": None,
+                },
+                "errors": [{"message": "Could not resolve to a Repository"}],
+            },
+            status=200,
+        )
+
+        client = GitHubClient(mock_github_token)
+        result = client.get_repos_bulk([("user", "repo1"), ("user", "missing")])
+        assert result == {
+            ("user", "repo1"): {
+                "description": "A repo",
+                "license": {"key": "mit"},
+                "topics": ["python"],
+            }
+        }
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert body["variables"] == {"o0": "user", "n0": "repo1", "o1": "user", "n1": "missing"}
+
+    @responses.activate
+    def test_get_repos_bulk_error(self, mock_github_token):
+        """Test that a GraphQL response without data raises."""
+        responses.add(
+            responses.POST,
+            "https://api.github.com/graphql",
+            json={"errors": [{"message": "Bad credentials"}]},
+            status=200,
+        )
+
+        client = GitHubClient(mock_github_token)
+        with pytest.raises(GitHubAPIError, match="Bad credentials"):
+            client.get_repos_bulk([("user", "repo1")])
 
     @responses.activate
     def test_network_error_handling(self, mock_github_token):
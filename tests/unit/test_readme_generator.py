@@ -1,109 +1,157 @@
 """Unit tests for OrgReadmeGenerator."""
 
+import io
+import json
+import re
+
 import pytest
 import responses
 
-from gh_toolkit.core.github_client import GitHubClient
-from gh_toolkit.core.readme_generator import OrgReadmeGenerator
-
-
-@pytest.fixture
+from gh_toolkit.core.readme_generator import OrgReadmeGenerator, _infer_category
+from tests.helpers import assert_all_in
+
+
+_SAMPLE_ORG_INFO = {
+    "login": "test-org",
+    "id": 12345,
+    "description": "A test organization for demonstration",
+    "html_url": "https://github.com/test-org",
+    "avatar_url": "https://avatars.githubusercontent.com/u/12345",
+    "blog": "https://test-org.example.com",
+    "location": "San Francisco, CA",
+    "public_repos": 10,
+    "name": "Test Organization",
+    "email": "contact@test-org.example.com",
+}
+
+_SAMPLE_ORG_REPOS = [
+    {
+        "name": "python-lib",
+        "full_name": "test-org/python-lib",
+        "description": "A Python library for testing",
+        "language": "Python",
+        "stargazers_count": 100,
+        "forks_count": 25,
+        "topics": ["python", "library", "testing"],
+        "html_url": "https://github.com/test-org/python-lib",
+        "private": False,
+        "fork": False,
+        "archived": False,
+        "license": {"spdx_id": "MIT"},
+    },
+    {
+        "name": "web-app",
+        "full_name": "test-org/web-app",
+        "description": "A web application built with React",
+        "language": "JavaScript",
+        "stargazers_count": 50,
+        "forks_count": 10,
+        "topics": ["react", "javascript", "web-app"],
+        "html_url": "https://github.com/test-org/web-app",
+        "private": False,
+        "fork": False,
+        "archived": False,
+        "license": {"spdx_id": "Apache-2.0"},
+    },
+    {
+        "name": "forked-repo",
+        "full_name": "test-org/forked-repo",
+        "description": "A forked repository",
+        "language": "Python",
+        "stargazers_count": 5,
+        "forks_count": 1,
+        "topics": [],
+        "html_url": "https://github.com/test-org/forked-repo",
+        "private": False,
+        "fork": True,
+        "archived": False,
+        "license": None,
+    },
+]
+
+# Response bodies, serialized once rather than by responses on every registration
+_ORG_INFO_JSON = json.dumps(_SAMPLE_ORG_INFO).encode()
+_ORG_REPOS_JSON = json.dumps(_SAMPLE_ORG_REPOS).encode()
+
+
+@pytest.fixture(scope="module")
 def sample_org_info():
     """Sample organization data for testing."""
-    return {
-        "login": "test-org",
-        "id": 12345,
-        "description": "A test organization for demonstration",
-        "html_url": "https://github.com/test-org",
-        "avatar_url": "https://avatars.githubusercontent.com/u/12345",
-        "blog": "https://test-org.example.com",
-        "location": "San Francisco, CA",
-        "public_repos": 10,
-        "name": "Test Organization",
-        "email": "contact@test-org.example.com",
-    }
+    return _SAMPLE_ORG_INFO
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_org_repos():
     """Sample organization repositories for testing."""
-    return [
-        {
-            "name": "python-lib",
-            "full_name": "test-org/python-lib",
-            "description": "A Python library for testing",
-            "language": "Python",
-            "stargazers_count": 100,
-            "forks_count": 25,
-            "topics": ["python", "library", "testing"],
-            "html_url": "https://github.com/test-org/python-lib",
-            "private": False,
-            "fork": False,
-            "archived": False,
-            "license": {"spdx_id": "MIT"},
-        },
-        {
-            "name": "web-app",
-            "full_name": "test-org/web-app",
-            "description": "A web application built with React",
-            "language": "JavaScript",
-            "stargazers_count": 50,
-            "forks_count": 10,
-            "topics": ["react", "javascript", "web-app"],
-            "html_url": "https://github.com/test-org/web-app",
-            "private": False,
-            "fork": False,
-            "archived": False,
-            "license": {"spdx_id": "Apache-2.0"},
-        },
-        {
-            "name": "forked-repo",
-            "full_name": "test-org/forked-repo",
-            "description": "A forked repository",
-            "language": "Python",
-            "stargazers_count": 5,
-            "forks_count": 1,
-            "topics": [],
-            "html_url": "https://github.com/test-org/forked-repo",
-            "private": False,
-            "fork": True,
-            "archived": False,
-            "license": None,
-        },
-    ]
+    return _SAMPLE_ORG_REPOS
+
+
+@pytest.fixture(scope="module")
+def sample_org_repos_no_forks(sample_org_repos):
+    """The sample repositories that are not forks."""
+    return [r for r in sample_org_repos if not r.get("fork")]
+
+
+@pytest.fixture(scope="module")
+def generator(gh_client):
+    """OrgReadmeGenerator without an Anthropic key, shared by the module's tests."""
+    return OrgReadmeGenerator(gh_client)
+
+
+def register_org_endpoints(mock, org="test-org", repos=None, info=None):
+    """Serve an org's info and its repos (as a single page) from one callback.
+
+    The repos page has no Link header, so pagination stops after it.
+    """
+    org_url = f"https://api.github.com/orgs/{org}"
+    routes = {
+        org_url: _ORG_INFO_JSON if info is None else json.dumps(info),
+        f"{org_url}/repos": _ORG_REPOS_JSON if repos is None else json.dumps(repos),
+    }
+
+    def dispatch(request):
+        return 200, {}, routes[request.url.split("?", 1)[0]]
+
+    mock.add_callback(
+        "GET",
+        re.compile(rf"{re.escape(org_url)}(/repos)?(\?.*)?$"),
+        callback=dispatch,
+        content_type="application/json",
+    )
+
+
+@pytest.fixture
+def mock_org_endpoints(rsps):
+    """Factory registering org endpoints on the test's rsps mock."""
+
+    def setup(*args, **kwargs):
+        register_org_endpoints(rsps, *args, **kwargs)
+
+    return setup
+
+
+@pytest.fixture(scope="module")
+def generated_readmes(generator):
+    """test-org's README for each template, generated once per module."""
+    readmes = {}
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        register_org_endpoints(mock)
+        for template in ("default", "minimal", "detailed"):
+            readmes[template] = generator.generate_readme("test-org", template=template)
+    return readmes
 
 
 class TestOrgReadmeGenerator:
     """Test OrgReadmeGenerator functionality."""
 
-    def test_init_without_anthropic(self, mock_github_token):
+    def test_init_without_anthropic(self, gh_client, generator):
         """Test initialization without Anthropic API key."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        assert generator.client == client
+        assert generator.client == gh_client
         assert generator._anthropic_client is None
 
-    @responses.activate
-    def test_fetch_org_repos(self, mock_github_token, sample_org_repos):
+    def test_fetch_org_repos(self, generator, mock_org_endpoints):
         """Test fetching organization repositories."""
-        # Add initial response
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        # Add empty second page to end pagination
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints()
 
         repos = generator.fetch_org_repos("test-org")
 
@@ -111,47 +159,17 @@ class TestOrgReadmeGenerator:
         assert len(repos) == 2
         assert all(not r.get("fork") for r in repos)
 
-    @responses.activate
-    def test_fetch_org_repos_include_forks(self, mock_github_token, sample_org_repos):
+    def test_fetch_org_repos_include_forks(self, generator, mock_org_endpoints):
         """Test fetching organization repositories including forks."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints()
 
         repos = generator.fetch_org_repos("test-org", exclude_forks=False)
 
         assert len(repos) == 3
 
-    @responses.activate
-    def test_fetch_org_repos_min_stars(self, mock_github_token, sample_org_repos):
+    def test_fetch_org_repos_min_stars(self, generator, mock_org_endpoints):
         """Test fetching organization repositories with minimum stars filter."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints()
 
         repos = generator.fetch_org_repos("test-org", min_stars=60)
 
@@ -159,24 +177,9 @@ class TestOrgReadmeGenerator:
         assert len(repos) == 1
         assert repos[0]["name"] == "python-lib"
 
-    @responses.activate
-    def test_fetch_org_repos_max_repos(self, mock_github_token, sample_org_repos):
+    def test_fetch_org_repos_max_repos(self, generator, mock_org_endpoints):
         """Test fetching organization repositories with max repos limit."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints()
 
         repos = generator.fetch_org_repos("test-org", max_repos=1)
 
@@ -184,46 +187,27 @@ class TestOrgReadmeGenerator:
         # Should be sorted by stars, so python-lib should be first
         assert repos[0]["name"] == "python-lib"
 
-    def test_categorize_repos_by_category(self, mock_github_token, sample_org_repos):
-        """Test categorizing repositories by inferred category."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        # Use only non-forked repos
-        repos = [r for r in sample_org_repos if not r.get("fork")]
-        grouped = generator.categorize_repos(repos, group_by="category")
-
-        assert len(grouped) > 0
-
-    def test_categorize_repos_by_language(self, mock_github_token, sample_org_repos):
-        """Test categorizing repositories by language."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        repos = [r for r in sample_org_repos if not r.get("fork")]
-        grouped = generator.categorize_repos(repos, group_by="language")
-
-        assert "Python" in grouped
-        assert "JavaScript" in grouped
-        assert len(grouped["Python"]) == 1
-        assert len(grouped["JavaScript"]) == 1
-
-    def test_categorize_repos_by_topic(self, mock_github_token, sample_org_repos):
-        """Test categorizing repositories by topic."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        repos = [r for r in sample_org_repos if not r.get("fork")]
-        grouped = generator.categorize_repos(repos, group_by="topic")
+    @pytest.mark.parametrize(
+        "group_by,expected",
+        [
+            ("category", {"Libraries": 1, "Web Applications": 1}),
+            ("language", {"Python": 1, "JavaScript": 1}),
+            # Uses first topic
+            ("topic", {"python": 1, "react": 1}),
+        ],
+    )
+    def test_categorize_repos(
+        self, generator, sample_org_repos_no_forks, group_by, expected
+    ):
+        """Test categorizing repositories by category, language or topic."""
+        grouped = generator.categorize_repos(
+            sample_org_repos_no_forks, group_by=group_by
+        )
 
-        # Uses first topic
-        assert "python" in grouped or "react" in grouped
+        assert {group: len(items) for group, items in grouped.items()} == expected
 
-    def test_infer_category_library(self, mock_github_token):
+    def test_infer_category_library(self, generator):
         """Test inferring library category."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
         repo = {
             "name": "my-lib",
             "description": "A library for doing things",
@@ -234,11 +218,8 @@ class TestOrgReadmeGenerator:
         category = generator.infer_category(repo)
         assert category == "Libraries"
 
-    def test_infer_category_template(self, mock_github_token):
+    def test_infer_category_template(self, generator):
         """Test inferring template category."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
         repo = {
             "name": "python-template",
             "description": "A starter template for Python projects",
@@ -249,11 +230,8 @@ class TestOrgReadmeGenerator:
         category = generator.infer_category(repo)
         assert category == "Templates"
 
-    def test_infer_category_web_app(self, mock_github_token):
+    def test_infer_category_web_app(self, generator):
         """Test inferring web application category."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
         repo = {
             "name": "my-site",
             "description": "A web app for managing tasks",
@@ -264,15 +242,29 @@ class TestOrgReadmeGenerator:
         category = generator.infer_category(repo)
         assert category == "Web Applications"
 
+    def test_infer_category_cached(self, generator):
+        """Test that repeated inference for the same repo hits the cache."""
+        repo = {
+            "name": "my-cli",
+            "description": "A command-line tool",
+            "language": "Go",
+            "topics": ["devtools"],
+        }
+
+        first = generator.infer_category(repo)
+        hits = _infer_category.cache_info().hits
+        second = generator.infer_category(dict(repo))
+
+        assert first == second == "CLI Tools"
+        assert _infer_category.cache_info().hits == hits + 1
+
     def test_generate_fallback_description(
-        self, mock_github_token, sample_org_info, sample_org_repos
+        self, generator, sample_org_info, sample_org_repos_no_forks
     ):
         """Test generating fallback description without LLM."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        repos = [r for r in sample_org_repos if not r.get("fork")]
-        description = generator._generate_fallback_description(sample_org_info, repos)
+        description = generator._generate_fallback_description(
+            sample_org_info, sample_org_repos_no_forks
+        )
 
         assert "title" in description
         assert "tagline" in description
@@ -280,172 +272,56 @@ class TestOrgReadmeGenerator:
         assert "mission" in description
         assert description["title"] == "test-org"
 
-    @responses.activate
-    def test_generate_readme_default_template(
-        self, mock_github_token, sample_org_info, sample_org_repos
-    ):
-        """Test generating README with default template."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org",
-            json=sample_org_info,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        readme = generator.generate_readme("test-org", template="default")
-
-        # Check structure
-        assert "# test-org" in readme
-        assert "## Repositories" in readme
-        assert "## Stats" in readme
-        assert "gh-toolkit" in readme
-        # Check repos are included
-        assert "python-lib" in readme
-        assert "web-app" in readme
-
-    @responses.activate
-    def test_generate_readme_minimal_template(
-        self, mock_github_token, sample_org_info, sample_org_repos
-    ):
-        """Test generating README with minimal template."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org",
-            json=sample_org_info,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        readme = generator.generate_readme("test-org", template="minimal")
-
-        # Minimal template is simpler
-        assert "# test-org" in readme
-        assert "## Projects" in readme
-
-    @responses.activate
-    def test_generate_readme_detailed_template(
-        self, mock_github_token, sample_org_info, sample_org_repos
-    ):
-        """Test generating README with detailed template."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org",
-            json=sample_org_info,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
-
-        readme = generator.generate_readme("test-org", template="detailed")
-
-        # Detailed template includes more info
-        assert "# test-org" in readme
-        assert "## About" in readme
-        assert "## Statistics" in readme
-
-    @responses.activate
-    def test_generate_readme_no_stats(
-        self, mock_github_token, sample_org_info, sample_org_repos
-    ):
+    @pytest.mark.parametrize(
+        "template,expected",
+        [
+            (
+                "default",
+                [
+                    "# test-org",
+                    "## Repositories",
+                    "## Stats",
+                    "gh-toolkit",
+                    "python-lib",
+                    "web-app",
+                ],
+            ),
+            ("minimal", ["# test-org", "## Projects"]),
+            ("detailed", ["# test-org", "## About", "## Statistics"]),
+        ],
+    )
+    @pytest.mark.http
+    def test_generate_readme_template(self, generated_readmes, template, expected):
+        """Test generating README with each template."""
+        assert_all_in(generated_readmes[template], expected)
+
+    def test_generate_readme_no_stats(self, generator, mock_org_endpoints):
         """Test generating README without statistics."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org",
-            json=sample_org_info,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=sample_org_repos,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/test-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints()
 
         readme = generator.generate_readme("test-org", include_stats=False)
 
         # Stats section should not be present
         assert "## Stats" not in readme
 
-    @responses.activate
-    def test_generate_readme_no_repos_error(
-        self, mock_github_token, sample_org_info
-    ):
+    def test_generate_readme_no_repos_error(self, generator, mock_org_endpoints):
         """Test error when organization has no repositories."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/empty-org",
-            json=sample_org_info,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.github.com/orgs/empty-org/repos",
-            json=[],
-            status=200,
-        )
-
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+        mock_org_endpoints("empty-org", repos=[])
 
         with pytest.raises(ValueError, match="No repositories found"):
             generator.generate_readme("empty-org")
 
-    def test_save_readme(self, mock_github_token, tmp_path):
-        """Test saving README to file."""
-        client = GitHubClient(mock_github_token)
-        generator = OrgReadmeGenerator(client)
+    def test_save_readme_to_stream(self, generator):
+        """Test saving README to an open text stream."""
+        content = "# Test README\n\nThis is a test."
+        buffer = io.StringIO()
 
+        generator.save_readme(content, buffer)
+
+        assert buffer.getvalue() == content
+
+    def test_save_readme(self, generator, tmp_path):
+        """Test saving README to file."""
         content = "# Test README\n\nThis is a test."
         output_path = tmp_path / "README.md"
 
@@ -228,13 +228,12 @@ class TestRepositoryExtractor:
         assert category == "Other Tool"
         assert confidence > 0.0
 
-    @responses.activate
-    def test_extract_repository_data_success(self, mock_github_token):
+    def test_extract_repository_data_success(self, gh_mock, mock_github_token):
         """Test successful repository data extraction."""
         repo_name = "testuser/test-repo"
 
         # Mock repo info
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo",
             json={
@@ -256,7 +255,7 @@ class TestRepositoryExtractor:
         )
 
         # Mock topics
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/topics",
             json={"names": ["python", "testing"]},
@@ -264,22 +263,15 @@ class TestRepositoryExtractor:
         )
 
         # Mock languages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/languages",
             json={"Python": 15000, "Shell": 500},
             status=200,
         )
 
-        # Mock README
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         # Mock releases
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/releases",
             json=[],
@@ -287,7 +279,7 @@ class TestRepositoryExtractor:
         )
 
         # Mock GitHub Pages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/pages",
             status=404,
@@ -68,15 +68,8 @@ class TestTopicTagger:
         result = tagger.get_readme_content("testuser", "test-repo")
         assert result == "Test README"
 
-    @responses.activate
-    def test_get_readme_content_not_found(self, mock_github_token):
+    def test_get_readme_content_not_found(self, gh_mock, mock_github_token):
         """Test README content retrieval when file not found."""
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         client = GitHubClient(mock_github_token)
         tagger = TopicTagger(client)
 
@@ -255,11 +248,10 @@ class TestTopicTagger:
         result = tagger.update_repo_topics("testuser", "test-repo", ["python", "cli"])
         assert result is False
 
-    @responses.activate
-    def test_process_repository_success(self, mock_github_token):
+    def test_process_repository_success(self, gh_mock, mock_github_token):
         """Test successful repository processing."""
         # Mock repo info
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo",
             json={
@@ -273,7 +265,7 @@ class TestTopicTagger:
         )
 
         # Mock languages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/languages",
             json={"Python": 1000},
@@ -281,20 +273,13 @@ class TestTopicTagger:
         )
 
         # Mock current topics (empty)
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/topics",
             json={"names": []},
             status=200,
         )
 
-        # Mock README
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         client = GitHubClient(mock_github_token)
         tagger = TopicTagger(client)
 
@@ -349,11 +334,10 @@ class TestTopicTagger:
         assert result["status"] == "skipped"
         assert result["current_topics"] == ["existing", "topics"]
 
-    @responses.activate
-    def test_process_repository_force_update(self, mock_github_token):
+    def test_process_repository_force_update(self, gh_mock, mock_github_token):
         """Test repository processing with force update."""
         # Mock repo info
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo",
             json={
@@ -367,7 +351,7 @@ class TestTopicTagger:
         )
 
         # Mock languages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/languages",
             json={"Python": 1000},
@@ -375,20 +359,13 @@ class TestTopicTagger:
         )
 
         # Mock current topics (has topics)
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/topics",
             json={"names": ["existing", "topic"]},
             status=200,
         )
 
-        # Mock README
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         client = GitHubClient(mock_github_token)
         tagger = TopicTagger(client)
 
@@ -492,11 +469,10 @@ class TestTopicTagger:
         assert "-invalid-" not in topics
         assert "too-long-topic-name-that-exceeds-fifty-characters-limit" not in topics
 
-    @responses.activate
-    def test_process_repository_warns_missing_description(self, mock_github_token):
+    def test_process_repository_warns_missing_description(self, gh_mock, mock_github_token):
         """Test that processing warns when description is missing."""
         # Mock repo info without description
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo",
             json={
@@ -510,7 +486,7 @@ class TestTopicTagger:
         )
 
         # Mock languages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/languages",
             json={"Python": 1000},
@@ -518,20 +494,13 @@ class TestTopicTagger:
         )
 
         # Mock current topics (empty)
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/topics",
             json={"names": []},
             status=200,
         )
 
-        # Mock README
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         client = GitHubClient(mock_github_token)
         tagger = TopicTagger(client)
 
@@ -541,11 +510,10 @@ class TestTopicTagger:
         assert "warnings" in result
         assert "missing_description" in result["warnings"]
 
-    @responses.activate
-    def test_process_repository_no_warning_with_description(self, mock_github_token):
+    def test_process_repository_no_warning_with_description(self, gh_mock, mock_github_token):
         """Test that processing does not warn when description exists."""
         # Mock repo info with description
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo",
             json={
@@ -559,7 +527,7 @@ class TestTopicTagger:
         )
 
         # Mock languages
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/languages",
             json={"Python": 1000},
@@ -567,20 +535,13 @@ class TestTopicTagger:
         )
 
         # Mock current topics (empty)
-        responses.add(
+        gh_mock.add(
             responses.GET,
             "https://api.github.com/repos/testuser/test-repo/topics",
             json={"names": []},
             status=200,
         )
 
-        # Mock README
-        responses.add(
-            responses.GET,
-            "https://api.github.com/repos/testuser/test-repo/readme",
-            status=404,
-        )
-
         client = GitHubClient(mock_github_token)
         tagger = TopicTagger(client)
 
@@ -0,0 +1,356 @@
+"""Unit tests for the TUI screens."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("textual")
+
+from textual.widgets import Checkbox, Input  # noqa: E402
+
+import gh_toolkit.tui.app  # noqa: E402
+import gh_toolkit.tui.screens.preview  # noqa: E402
+from gh_toolkit.tui.app import (  # noqa: E402
+    GhToolkitApp,
+    _load_page_cache,
+    _save_page_cache,
+)
+from gh_toolkit.tui.cache import write_cache_file  # noqa: E402
+from gh_toolkit.tui.screens.org import OrgScreen  # noqa: E402
+from gh_toolkit.tui.screens.preview import PreviewScreen  # noqa: E402
+from gh_toolkit.tui.widgets.action_modal import ActionModal  # noqa: E402
+
+
+class ScreenApp(GhToolkitApp):
+    """App that opens straight onto the given screen and records notifications."""
+
+    # CSS_PATH is resolved relative to the defining module
+    CSS_PATH = Path(gh_toolkit.tui.app.__file__).parent / GhToolkitApp.CSS_PATH
+
+    def __init__(self, screen, on_dismiss=None):
+        super().__init__()
+        self._start_screen = screen
+        self._on_dismiss = on_dismiss
+        self.notifications = []
+
+    def on_mount(self, event):
+        # Skip GhToolkitApp.on_mount, which would push the home screen on top
+        event.prevent_default()
+        self.push_screen(self._start_screen, self._on_dismiss)
+
+    def notify(self, message, **kwargs):
+        self.notifications.append((message, kwargs.get("severity", "information")))
+
+
+def run_app(app, interact):
+    """Run the app headless, awaiting interact(pilot) once its workers settle."""
+
+    async def run():
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            await interact(pilot)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.is_running
+
+    asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def tmp_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk caches of the app under test out of the user's home."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(gh_toolkit.tui.app, "ORG_CACHE_DIR", cache_dir / "orgs")
+    monkeypatch.setattr(
+        gh_toolkit.tui.screens.preview, "README_CACHE_DIR", cache_dir / "readmes"
+    )
+    return cache_dir
+
+
+class TestCacheFiles:
+    """Test the on-disk cache helpers."""
+
+    def test_page_cache_round_trip(self):
+        """Saved pages load back with their page numbers and ETags."""
+        pages = {1: ('"etag-1"', [{"id": 1}]), 2: ('"etag-2"', [{"id": 2}])}
+        _save_page_cache("test-org", pages)
+
+        assert _load_page_cache("test-org") == pages
+
+    def test_page_cache_missing_or_corrupt(self, tmp_cache_dir):
+        """A missing or unreadable page cache loads as empty."""
+        assert _load_page_cache("test-org") == {}
+
+        (tmp_cache_dir / "orgs").mkdir(parents=True)
+        (tmp_cache_dir / "orgs" / "test-org.json").write_text("{not json")
+        assert _load_page_cache("test-org") == {}
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """A write that can't replace its target cleans up its temp file."""
+        target = tmp_path / "entry"
+        # Replacing a non-empty directory fails, even as root
+        (target / "child").mkdir(parents=True)
+
+        write_cache_file(target, "content")
+
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestGhToolkitApp:
+    """Test the app's org repository cache."""
+
+    def test_fetch_overtaken_by_refresh_is_not_cached(self, rsps, tmp_cache_dir):
+        """A fetch that a refresh replaced can't overwrite the refreshed cache."""
+        app = GhToolkitApp()
+
+        def serve_repos(request):
+            # The user refreshes while this fetch is still in flight
+            app.clear_org_cache("test-org")
+            return 200, {"ETag": '"v1"'}, json.dumps([{"id": 1, "name": "old"}])
+
+        rsps.add_callback(
+            "GET", "https://api.github.com/orgs/test-org/repos", callback=serve_repos
+        )
+
+        assert [repo["name"] for repo in app.get_org_repos("test-org")] == ["old"]
+        assert "test-org" not in app._org_cache
+        assert not (tmp_cache_dir / "orgs").exists()
+
+
+class TestOrgScreen:
+    """Test OrgScreen repository loading."""
+
+    def test_auth_error_shows_token_hint(self, rsps):
+        """A 401 while fetching repos is shown in the stats bar, not fatal."""
+        rsps.get(
+            "https://api.github.com/orgs/test-org/repos",
+            json={"message": "Bad credentials"},
+            status=401,
+        )
+        screen = OrgScreen({"login": "test-org"})
+        app = ScreenApp(screen)
+
+        async def check(pilot):
+            assert "check GITHUB_TOKEN" in str(screen._stats_bar.render())
+
+        run_app(app, check)
+
+    @pytest.fixture
+    def loaded_screen(self, rsps):
+        """OrgScreen whose fetch returns three repos, shown sorted by stars."""
+        rsps.get(
+            "https://api.github.com/orgs/test-org/repos",
+            json=[
+                {"id": i, "name": name, "stargazers_count": stars}
+                for i, (name, stars) in enumerate([("a", 30), ("b", 20), ("c", 10)])
+            ],
+        )
+        return OrgScreen({"login": "test-org"})
+
+    def test_later_page_keeps_highlighted_repo(self, loaded_screen):
+        """A page that sorts in above the cursor doesn't move it off its repo."""
+        screen = loaded_screen
+
+        async def add_page(pilot):
+            await pilot.press("down")
+            assert screen._list_view.highlighted_row.name == "b"
+
+            screen._add_repositories(
+                [{"id": 9, "name": "top", "stargazers_count": 99}],
+                screen._fetch_generation,
+            )
+
+            names = [row.name for row in screen._list_view.rows]
+            assert names == ["top", "a", "b", "c"]
+            assert screen._list_view.highlighted_row.name == "b"
+
+        run_app(ScreenApp(screen), add_page)
+
+    def test_single_refresh_reloads_immediately(self, loaded_screen, monkeypatch):
+        """One refresh reloads at once; a quick repeat is deferred and coalesced."""
+        screen = loaded_screen
+        reloads = []
+
+        async def refresh_twice(pilot):
+            monkeypatch.setattr(screen, "_reload", lambda: reloads.append(1))
+            screen.refresh_data()
+            assert len(reloads) == 1
+
+            screen.refresh_data()
+            assert len(reloads) == 1
+            await pilot.pause(0.3)
+            assert len(reloads) == 2
+
+        run_app(ScreenApp(screen), refresh_twice)
+
+    def test_page_from_replaced_fetch_is_dropped(self, loaded_screen):
+        """Pages delivered for an earlier fetch generation are ignored."""
+        screen = loaded_screen
+
+        async def add_stale_page(pilot):
+            screen._add_repositories(
+                [{"id": 9, "name": "stale", "stargazers_count": 99}],
+                screen._fetch_generation - 1,
+            )
+
+            assert [row.name for row in screen._list_view.rows] == ["a", "b", "c"]
+
+        run_app(ScreenApp(screen), add_stale_page)
+
+    def test_readme_opened_mid_fetch_is_not_cached(
+        self, rsps, tmp_cache_dir, monkeypatch
+    ):
+        """A README generated before every page arrives isn't stored in the cache."""
+        monkeypatch.setattr(
+            gh_toolkit.tui.screens.preview, "OrgReadmeGenerator", FakeReadmeGenerator
+        )
+        monkeypatch.setattr(FakeReadmeGenerator, "calls", 0)
+        url = "https://api.github.com/orgs/test-org/repos"
+        release_page_2 = threading.Event()
+
+        def serve_page(request):
+            page = parse_qs(urlparse(request.url).query)["page"][0]
+            if page == "1":
+                link = f'<{url}?page=2>; rel="last"'
+                return 200, {"Link": link}, json.dumps([{"id": 1, "name": "a"}])
+            release_page_2.wait(10)
+            return 200, {}, json.dumps([{"id": 2, "name": "b"}])
+
+        rsps.add_callback("GET", url, callback=serve_page)
+        screen = OrgScreen({"login": "test-org"})
+        app = ScreenApp(screen)
+
+        async def run():
+            async with app.run_test() as pilot:
+                try:
+                    while not screen._repos:
+                        await pilot.pause(0.01)
+                    # The list only takes focus once the fetch has finished
+                    screen._list_view.focus()
+                    await pilot.press("g")
+                    await pilot.pause()
+                    assert isinstance(app.screen, PreviewScreen)
+                finally:
+                    release_page_2.set()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert not (tmp_cache_dir / "readmes").exists()
+
+                # Once the fetch is complete the preview uses the cache
+                await pilot.press("escape", "g")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert list((tmp_cache_dir / "readmes").glob("*.md"))
+
+        asyncio.run(run())
+
+        assert FakeReadmeGenerator.calls == 2
+
+
+class FakeReadmeGenerator:
+    """Stands in for OrgReadmeGenerator, counting the READMEs it generates."""
+
+    calls = 0
+
+    def __init__(self, client, anthropic_api_key=None):
+        pass
+
+    def generate_readme(self, org_name, **kwargs):
+        FakeReadmeGenerator.calls += 1
+        return f"# {org_name} ({FakeReadmeGenerator.calls})\n"
+
+
+class TestPreviewScreen:
+    """Test PreviewScreen saving and caching."""
+
+    REPOS = [
+        {"id": 1, "name": "alpha", "updated_at": "2024-01-01T00:00:00Z"},
+        {"id": 2, "name": "beta", "updated_at": "2024-01-02T00:00:00Z"},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def fake_generator(self, monkeypatch):
+        """Generate READMEs without calling GitHub."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(FakeReadmeGenerator, "calls", 0)
+        monkeypatch.setattr(
+            gh_toolkit.tui.screens.preview, "OrgReadmeGenerator", FakeReadmeGenerator
+        )
+
+    @pytest.fixture
+    def preview_screen(self):
+        """PreviewScreen for an org with a couple of repos."""
+        return PreviewScreen("test-org", {"login": "test-org"}, self.REPOS)
+
+    def open_preview(self, repos):
+        """Open a preview of test-org's README and return the content shown."""
+        screen = PreviewScreen("test-org", {"login": "test-org"}, repos)
+
+        async def settle(pilot):
+            pass
+
+        run_app(ScreenApp(screen), settle)
+        return screen._readme_content
+
+    def test_readme_cache_reused_until_repos_change(self):
+        """A README is generated once per repo state, then read from disk."""
+        first = self.open_preview(self.REPOS)
+        assert self.open_preview(self.REPOS) == first
+        assert FakeReadmeGenerator.calls == 1
+
+        changed = [*self.REPOS[:1], {**self.REPOS[1], "updated_at": "2024-02-01"}]
+        assert self.open_preview(changed) != first
+        assert FakeReadmeGenerator.calls == 2
+
+    def test_no_repos_skips_cache(self, tmp_cache_dir):
+        """Without repos to key on, every preview generates a fresh README."""
+        self.open_preview([])
+        self.open_preview([])
+
+        assert FakeReadmeGenerator.calls == 2
+        assert not (tmp_cache_dir / "readmes").exists()
+
+    def test_save_to_unwritable_path_reports_error(
+        self, preview_screen, tmp_path, monkeypatch
+    ):
+        """A failed write is shown as a notification and the app keeps running."""
+        monkeypatch.chdir(tmp_path)
+        # A directory where the README should go makes the write fail, even as root
+        (tmp_path / "test-org-README.md").mkdir()
+        app = ScreenApp(preview_screen)
+
+        async def save(pilot):
+            await pilot.press("s")
+
+        run_app(app, save)
+
+        assert any(
+            severity == "error" and message.startswith("Failed to save")
+            for message, severity in app.notifications
+        )
+
+
+class TestActionModal:
+    """Test ActionModal option gathering."""
+
+    def test_tag_options_read_from_lazily_built_widgets(self):
+        """Options come from the widgets built when the tag section is opened."""
+        modal = ActionModal([("owner", "repo")], "repos")
+        results = []
+
+        async def choose_tag(pilot):
+            modal.query_one("#action-tag", Checkbox).value = True
+            await pilot.pause()
+            modal.query_one("#tag-preferred", Input).value = "edtech: Educational"
+            modal.action_execute()
+
+        run_app(ScreenApp(modal, results.append), choose_tag)
+
+        [result] = results
+        assert result.actions == ("tag",)
+        assert result.options["tag_preferred"] == "edtech: Educational"